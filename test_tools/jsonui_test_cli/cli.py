@@ -280,7 +280,7 @@ def cmd_generate_html(args):
     print()
 
     try:
-        files = generate_html_directory(input_dir, output_dir, title, docs_dirs if docs_dirs else None)
+        files = generate_html_directory(input_dir, output_dir, title, docs_dirs if docs_dirs else None, args.jobs, args.incremental)
         print()
         print(f"Generated {len(files)} HTML files")
         print(f"Open {output_dir}/index.html to view documentation")
@@ -590,6 +590,18 @@ def main():
         metavar="DIR",
         help="Directory containing OpenAPI/Swagger files (can be specified multiple times, e.g., -d api -d db)"
     )
+    gen_html_parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Number of worker processes for test pages (default: 1, 0 = one per CPU)"
+    )
+    gen_html_parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only regenerate test pages whose test file or referenced files changed"
+    )
 
     # Generate mermaid subcommand
     gen_mermaid_parser = generate_subparsers.add_parser(
@@ -2,28 +2,43 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
+
+from . import __version__
 from .validator import TestValidator, ValidationResult
 from .html import (
     generate_screen_html,
     generate_flow_html,
     generate_index_html,
     generate_document_html,
-    is_swagger_file,
-    parse_swagger_file,
+    load_swagger_file,
     generate_swagger_html,
     has_api_paths,
     generate_schema_html,
     generate_erd_html,
+    write_erd_assets,
+    write_style_assets,
 )
-from .html.sidebar import escape_html
+from .html.sidebar import escape_html, generated_timestamp, render_nav_items
+from .html.styles import SCREEN_STYLESHEET, FLOW_STYLESHEET
 from .markdown import generate_markdown, generate_schema_markdown
 from .mermaid import generate_mermaid_html
 
 
+# Written to the output directory by incremental builds
+BUILD_MANIFEST_NAME = ".jsonui-test-build.json"
+
+
 class DocumentGenerator:
     """Generates human-readable documentation from test files."""
 
@@ -31,7 +46,14 @@ class DocumentGenerator:
         self.validator = TestValidator()
         self._test_file_path: Path | None = None
         self._all_tests_nav: dict | None = None  # {'screens': [...], 'flows': [...]}
+        self._nav_items: dict[str, str] | None = None  # _all_tests_nav list items, rendered once per build
         self._current_test_path: str | None = None  # Current test's relative HTML path
+        self._link_stylesheets = False  # Link the shared assets/ stylesheets instead of inlining styles
+        self._generated_at: str | None = None  # "Generated:" timestamp shared by every page of a build
+        self._ref_file_cache: dict[tuple[Path, str], tuple[Path | None, list[Path]]] = {}
+        self._json_cache: dict[Path, Any] = {}
+        self._page_deps: set[Path] = set()  # Files read while rendering the current page
+        self._missing_deps: set[Path] = set()  # Files looked up but not found while rendering it
 
     def _resolve_description(self, case: dict) -> dict | str:
         """
@@ -56,11 +78,12 @@ class DocumentGenerator:
             desc_path = Path(desc_file_path)
             if desc_path.exists():
                 try:
-                    with open(desc_path, 'r', encoding='utf-8') as f:
-                        return json.load(f)
+                    return self._load_json(desc_path)
                 except Exception as e:
                     return f"[Error reading {case['descriptionFile']}: {e}]"
             else:
+                # Recorded so an incremental build notices when the file appears
+                self._missing_deps.add(desc_path)
                 return f"[Description file not found: {case['descriptionFile']}]"
 
         # Fall back to inline description
@@ -89,11 +112,12 @@ class DocumentGenerator:
             desc_path = Path(desc_file_path)
             if desc_path.exists():
                 try:
-                    with open(desc_path, 'r', encoding='utf-8') as f:
-                        return json.load(f)
+                    return self._load_json(desc_path)
                 except Exception as e:
                     return f"[Error reading {block_step['descriptionFile']}: {e}]"
             else:
+                # Recorded so an incremental build notices when the file appears
+                self._missing_deps.add(desc_path)
                 return f"[Description file not found: {block_step['descriptionFile']}]"
 
         # Fall back to inline description
@@ -222,8 +246,15 @@ class DocumentGenerator:
                 parts.append(f"        <p class='ref-notes'><strong>Notes:</strong> {escape_html(desc['notes'])}</p>")
         return parts
 
-    def _generate_html(self, result: ValidationResult) -> str:
-        """Generate HTML documentation."""
+    def _generate_html(self, result: ValidationResult, out: TextIO | None = None) -> str | None:
+        """
+        Generate HTML documentation.
+
+        Pages are written straight to out when given.
+
+        Returns:
+            HTML string, or None if the page was written to out
+        """
         data = result.test_data
         test_type = data.get("type", "screen")
 
@@ -240,19 +271,34 @@ class DocumentGenerator:
                 self._resolve_block_description,
                 self._format_block_description_html,
                 self._all_tests_nav,
-                self._current_test_path
-            )
-        else:
-            return generate_screen_html(
-                data,
-                result.file_path,
-                self._resolve_description,
-                self._format_description_html,
-                self._format_step_details,
-                self._all_tests_nav,
-                self._current_test_path
+                self._current_test_path,
+                out=out,
+                stylesheet_href=self._stylesheet_href(FLOW_STYLESHEET),
+                nav_items=self._nav_items,
+                generated_at=self._generated_at
             )
 
+        return generate_screen_html(
+            data,
+            result.file_path,
+            self._resolve_description,
+            self._format_description_html,
+            self._format_step_details,
+            self._all_tests_nav,
+            self._current_test_path,
+            out=out,
+            stylesheet_href=self._stylesheet_href(SCREEN_STYLESHEET),
+            nav_items=self._nav_items,
+            generated_at=self._generated_at
+        )
+
+    def _stylesheet_href(self, stylesheet: str) -> str | None:
+        """Get the link to a shared stylesheet from a test page, or None to inline styles."""
+        if not self._link_stylesheets:
+            return None
+        # Test pages live one level below the output root (screens/, flows/)
+        return f"../{stylesheet}"
+
     def _find_tests_root(self) -> Path:
         """Find the tests root directory (parent of flows/ or screens/)."""
         if not self._test_file_path:
@@ -270,23 +316,28 @@ class DocumentGenerator:
 
         return base_dir.parent
 
-    def _render_referenced_cases(self, file_ref: str, case_name: str | None, cases: list | None) -> list[str]:
+    def _find_ref_file(self, file_ref: str) -> Path | None:
         """
-        Load referenced test file and render its cases.
+        Find the test file referenced by a flow step.
+
+        Lookups are cached per (test directory, file_ref) for the whole run,
+        since the sidebar label and the step body resolve the same reference.
+        Candidates searched before the match (or all of them, if none exists)
+        are recorded as missing dependencies, on cache hits too.
 
         Args:
             file_ref: File reference path (e.g., "screens/login")
-            case_name: Single case name if specified
-            cases: List of case names if specified
 
         Returns:
-            List of HTML strings for the referenced cases
+            Path to the referenced file, or None if not found
         """
-        if not self._test_file_path:
-            return []
-
-        # Find tests root directory
         base_dir = self._test_file_path.parent
+        key = (base_dir, file_ref)
+        if key in self._ref_file_cache:
+            ref_file, missed = self._ref_file_cache[key]
+            self._missing_deps.update(missed)
+            return ref_file
+
         tests_root = self._find_tests_root()
 
         candidates = [
@@ -307,17 +358,51 @@ class DocumentGenerator:
         ]
 
         ref_file = None
+        missed = []
         for candidate in candidates:
             if candidate.exists():
                 ref_file = candidate
                 break
+            missed.append(candidate)
+
+        # Recorded so an incremental build notices when an earlier candidate appears
+        self._missing_deps.update(missed)
+        self._ref_file_cache[key] = (ref_file, missed)
+        return ref_file
+
+    def _load_json(self, path: Path) -> Any:
+        """Load a JSON file, reusing the parsed result for the rest of the run."""
+        self._page_deps.add(path)
+        if path not in self._json_cache:
+            if orjson is not None:
+                self._json_cache[path] = orjson.loads(path.read_bytes())
+            else:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self._json_cache[path] = json.load(f)
+        return self._json_cache[path]
+
+    def _render_referenced_cases(self, file_ref: str, case_name: str | None, cases: list | None) -> list[str]:
+        """
+        Load referenced test file and render its cases.
+
+        Args:
+            file_ref: File reference path (e.g., "screens/login")
+            case_name: Single case name if specified
+            cases: List of case names if specified
+
+        Returns:
+            List of HTML strings for the referenced cases
+        """
+        if not self._test_file_path:
+            return []
+
+        ref_file = self._find_ref_file(file_ref)
 
         if not ref_file:
             return [f"        <div class='step-detail warning'><em>Referenced file not found: {escape_html(file_ref)}</em></div>"]
 
         try:
-            with open(ref_file, 'r', encoding='utf-8') as f:
-                ref_data = json.load(f)
+            ref_data = self._load_json(ref_file)
         except Exception as e:
             return [f"        <div class='step-detail warning'><em>Error reading file: {escape_html(str(e))}</em></div>"]
 
@@ -390,10 +475,12 @@ class DocumentGenerator:
             desc_path = Path(desc_file_path)
             if desc_path.exists():
                 try:
-                    with open(desc_path, 'r', encoding='utf-8') as f:
-                        return json.load(f)
+                    return self._load_json(desc_path)
                 except Exception:
                     pass
+            else:
+                # Recorded so an incremental build notices when the file appears
+                self._missing_deps.add(desc_path)
         return case.get("description", "")
 
     def _get_ref_case_label(self, file_ref: str, case_name: str | None, cases_list: list | None) -> str:
@@ -405,39 +492,13 @@ class DocumentGenerator:
         if not self._test_file_path:
             return file_ref.split("/")[-1] if "/" in file_ref else file_ref
 
-        # Find tests root directory and resolve file
-        base_dir = self._test_file_path.parent
-        tests_root = self._find_tests_root()
-
-        candidates = [
-            # screens/{file_ref}/{file_ref}.test.json (subdirectory structure)
-            tests_root / "screens" / file_ref / f"{file_ref}.test.json",
-            tests_root / "screens" / file_ref / f"{file_ref}.json",
-            # screens/{file_ref}.test.json (flat structure)
-            tests_root / "screens" / f"{file_ref}.test.json",
-            tests_root / "screens" / f"{file_ref}.json",
-            # flows/{file_ref}/{file_ref}.test.json (subdirectory structure)
-            tests_root / "flows" / file_ref / f"{file_ref}.test.json",
-            # flows/{file_ref}.test.json (flat structure)
-            tests_root / "flows" / f"{file_ref}.test.json",
-            # Same directory as current test
-            base_dir / f"{file_ref}.test.json",
-            base_dir / f"{file_ref}.json",
-            base_dir / file_ref,
-        ]
-
-        ref_file = None
-        for candidate in candidates:
-            if candidate.exists():
-                ref_file = candidate
-                break
+        ref_file = self._find_ref_file(file_ref)
 
         if not ref_file:
             return file_ref.split("/")[-1] if "/" in file_ref else file_ref
 
         try:
-            with open(ref_file, 'r', encoding='utf-8') as f:
-                ref_data = json.load(f)
+            ref_data = self._load_json(ref_file)
         except Exception:
             return file_ref.split("/")[-1] if "/" in file_ref else file_ref
 
@@ -570,7 +631,9 @@ def generate_html_directory(
     input_dir: Path,
     output_dir: Path,
     title: str = "JsonUI Test Documentation",
-    docs_dirs: list[Path] | None = None
+    docs_dirs: list[Path] | None = None,
+    jobs: int = 1,
+    incremental: bool = False
 ) -> list[dict]:
     """
     Generate HTML documentation for all test files in a directory.
@@ -582,6 +645,8 @@ def generate_html_directory(
         output_dir: Directory to output HTML files
         title: Title for the index page
         docs_dirs: Optional list of directories containing OpenAPI/Swagger files
+        jobs: Number of worker processes for test pages (0 = one per CPU, 1 = no pool)
+        incremental: Skip test pages that are newer than every file they were built from
 
     Returns:
         List of generated file info dicts with 'name', 'path', 'type', 'cases'
@@ -589,6 +654,8 @@ def generate_html_directory(
     generator = DocumentGenerator()
     input_path = Path(input_dir)
     output_path = Path(output_dir)
+    # Taken once so every page of this build shows the same time
+    generated_at = generated_timestamp()
 
     # Create output directory
     output_path.mkdir(parents=True, exist_ok=True)
@@ -667,24 +734,23 @@ def generate_html_directory(
 
             category_files = []
             for json_file in sorted(docs_path.rglob("*.json")):
-                if is_swagger_file(json_file):
-                    swagger_data = parse_swagger_file(json_file)
-                    if swagger_data:
-                        info = swagger_data.get('info', {})
-                        api_name = info.get('title', json_file.stem)
-                        api_desc = info.get('description', '')
-                        # Output path: <category>/<filename>.html
-                        html_rel_path = f"{category_name}/{json_file.stem}.html"
-                        doc_info = {
-                            'name': api_name,
-                            'description': api_desc[:100] + '...' if len(api_desc) > 100 else api_desc,
-                            'path': html_rel_path,
-                            'source_file': json_file,
-                            'swagger_data': swagger_data,
-                            'category': category_name,
-                        }
-                        category_files.append(doc_info)
-                        all_api_doc_files.append(doc_info)
+                swagger_data = load_swagger_file(json_file)
+                if swagger_data:
+                    info = swagger_data.get('info', {})
+                    api_name = info.get('title', json_file.stem)
+                    api_desc = info.get('description', '')
+                    # Output path: <category>/<filename>.html
+                    html_rel_path = f"{category_name}/{json_file.stem}.html"
+                    doc_info = {
+                        'name': api_name,
+                        'description': api_desc[:100] + '...' if len(api_desc) > 100 else api_desc,
+                        'path': html_rel_path,
+                        'source_file': json_file,
+                        'swagger_data': swagger_data,
+                        'category': category_name,
+                    }
+                    category_files.append(doc_info)
+                    all_api_doc_files.append(doc_info)
 
             if category_files:
                 api_doc_categories[category_name] = category_files
@@ -698,42 +764,62 @@ def generate_html_directory(
         'api_doc_categories': {k: [{'name': d['name'], 'path': d['path']} for d in v] for k, v in api_doc_categories.items()},
     }
 
-    # Second pass: generate HTML with navigation
-    for file_info in file_infos:
-        try:
-            test_file = file_info['test_file']
-            result = file_info['result']
-            html_rel_path = file_info['path']
-
-            # Create subdirectory
-            html_path = output_path / html_rel_path
-            html_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Generate HTML with navigation
-            generator._test_file_path = test_file.resolve()
-            generator._all_tests_nav = all_tests_nav
-            generator._current_test_path = str(html_rel_path)
-            content = generator._generate_html(result)
-
-            with open(html_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-
-            # Add to generated files (without internal fields)
-            generated_files.append({
-                'name': file_info['name'],
-                'description': file_info['description'],
-                'path': html_rel_path,
-                'type': file_info['type'],
-                'case_count': file_info['case_count'],
-                'step_count': file_info['step_count'],
-                'platform': file_info['platform'],
-                'document': file_info.get('document'),
-            })
-
-            print(f"  Generated: {html_path}")
+    # Pages from the previous incremental build that need no regeneration
+    manifest_path = output_path / BUILD_MANIFEST_NAME
+    build_key = _build_key(title, all_tests_nav)
+    previous_deps = _read_build_manifest(manifest_path, build_key) if incremental else {}
+    page_deps: dict[str, dict[str, list[str]]] = {}
+    current = {
+        id(f) for f in file_infos
+        if _is_page_current(output_path / f['path'], f['test_file'], previous_deps.get(str(f['path'])))
+    }
+    stale_infos = [f for f in file_infos if id(f) not in current]
+
+    # Second pass: generate HTML with navigation. Pages link the shared
+    # stylesheets, which are rewritten on every build.
+    write_style_assets(output_path)
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    if jobs > 1 and len(stale_infos) > 1:
+        outcomes = iter(_write_test_pages_parallel(stale_infos, output_path, all_tests_nav, generated_at, jobs))
+    else:
+        generator._all_tests_nav = all_tests_nav
+        generator._nav_items = render_nav_items(all_tests_nav)
+        generator._link_stylesheets = True
+        generator._generated_at = generated_at
+        outcomes = (
+            _write_test_page(generator, f['test_file'], f['result'], f['path'], output_path)
+            for f in stale_infos
+        )
 
-        except Exception as e:
-            print(f"  Error processing {file_info['test_file']}: {e}")
+    for file_info in file_infos:
+        if id(file_info) in current:
+            page_deps[str(file_info['path'])] = previous_deps[str(file_info['path'])]
+            status = "Up to date"
+        else:
+            error, deps = next(outcomes)
+            if error:
+                print(f"  Error processing {file_info['test_file']}: {error}")
+                continue
+            page_deps[str(file_info['path'])] = deps
+            status = "Generated"
+
+        # Add to generated files (without internal fields)
+        generated_files.append({
+            'name': file_info['name'],
+            'description': file_info['description'],
+            'path': file_info['path'],
+            'type': file_info['type'],
+            'case_count': file_info['case_count'],
+            'step_count': file_info['step_count'],
+            'platform': file_info['platform'],
+            'document': file_info.get('document'),
+        })
+
+        print(f"  {status}: {output_path / file_info['path']}")
+
+    if incremental:
+        _write_build_manifest(manifest_path, build_key, page_deps)
 
     # Generate Mermaid diagram if there are flow files
     mermaid_generated = False
@@ -750,7 +836,10 @@ def generate_html_directory(
             print(f"  Warning: Could not generate Mermaid diagram: {e}")
 
     # Generate index.html
-    generate_index_html(output_path, generated_files, title, mermaid_generated, document_files, api_doc_categories)
+    generate_index_html(
+        output_path, generated_files, title, mermaid_generated, document_files, api_doc_categories,
+        generated_at=generated_at
+    )
 
     # Generate document pages (HTML with sidebar) for each document
     _generate_document_pages(input_path, output_path, generated_files, all_tests_nav)
@@ -761,6 +850,158 @@ def generate_html_directory(
     return generated_files
 
 
+def _write_test_page(
+    generator: DocumentGenerator,
+    test_file: Path,
+    result: ValidationResult,
+    html_rel_path: Path,
+    output_path: Path
+) -> tuple[str | None, dict[str, list[str]]]:
+    """
+    Write the HTML page for one validated test file.
+
+    Returns:
+        Tuple of (error message or None, page dependencies). Dependencies are
+        {'read': files read, 'missing': files looked up but not found}.
+    """
+    generator._page_deps = set()
+    generator._missing_deps = set()
+    try:
+        # Create subdirectory
+        html_path = output_path / html_rel_path
+        html_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Generate HTML with navigation
+        generator._test_file_path = test_file.resolve()
+        generator._current_test_path = str(html_rel_path)
+        with open(html_path, 'w', encoding='utf-8') as f:
+            generator._generate_html(result, out=f)
+    except Exception as e:
+        return str(e), {}
+    return None, {
+        'read': sorted(str(p) for p in generator._page_deps),
+        'missing': sorted(str(p) for p in generator._missing_deps),
+    }
+
+
+# Per-process generator used by _write_test_pages_parallel workers
+_worker_generator: DocumentGenerator | None = None
+
+
+def _init_page_worker(all_tests_nav: dict, generated_at: str) -> None:
+    """Create the generator for a page worker process."""
+    global _worker_generator
+    _worker_generator = DocumentGenerator()
+    _worker_generator._all_tests_nav = all_tests_nav
+    _worker_generator._nav_items = render_nav_items(all_tests_nav)
+    _worker_generator._link_stylesheets = True
+    _worker_generator._generated_at = generated_at
+
+
+def _write_test_page_in_worker(
+    test_file: Path,
+    result: ValidationResult,
+    html_rel_path: Path,
+    output_path: Path
+) -> tuple[str | None, dict[str, list[str]]]:
+    """Write one test page using the worker process's generator."""
+    return _write_test_page(_worker_generator, test_file, result, html_rel_path, output_path)
+
+
+def _write_test_pages_parallel(
+    file_infos: list[dict],
+    output_path: Path,
+    all_tests_nav: dict,
+    generated_at: str,
+    jobs: int
+) -> list[tuple[str | None, dict[str, list[str]]]]:
+    """
+    Write test pages across a pool of worker processes.
+
+    Largest test files are submitted first so a big flow does not start last
+    and hold up the whole run.
+
+    Returns:
+        (error message or None, page dependencies) for each entry of file_infos, in the same order
+    """
+    order = sorted(range(len(file_infos)), key=lambda i: file_infos[i]['test_file'].stat().st_size, reverse=True)
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_page_worker, initargs=(all_tests_nav, generated_at)) as pool:
+        futures = {
+            i: pool.submit(
+                _write_test_page_in_worker,
+                file_infos[i]['test_file'], file_infos[i]['result'], file_infos[i]['path'], output_path
+            )
+            for i in order
+        }
+        outcomes = []
+        for i in range(len(file_infos)):
+            try:
+                outcomes.append(futures[i].result())
+            except Exception as e:
+                outcomes.append((str(e), {}))
+        return outcomes
+
+
+def _build_key(title: str, all_tests_nav: dict) -> str:
+    """
+    Get a key for everything shared by all test pages of a build.
+
+    Every page embeds the navigation sidebar, so adding, removing or renaming
+    any test invalidates all pages.
+    """
+    payload = json.dumps(
+        {'version': __version__, 'title': title, 'nav': all_tests_nav},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _read_build_manifest(manifest_path: Path, build_key: str) -> dict[str, dict[str, list[str]]]:
+    """
+    Read page dependencies recorded by the previous incremental build.
+
+    Returns:
+        Dict of HTML path -> {'read': files read, 'missing': files not found}
+        while rendering it, or an empty dict if there is no usable manifest
+        for this build key
+    """
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(manifest, dict) or manifest.get('key') != build_key:
+        return {}
+    return manifest.get('pages', {})
+
+
+def _write_build_manifest(
+    manifest_path: Path,
+    build_key: str,
+    page_deps: dict[str, dict[str, list[str]]]
+) -> None:
+    """Record page dependencies for the next incremental build."""
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump({'key': build_key, 'pages': page_deps}, f, indent=2, ensure_ascii=False)
+
+
+def _is_page_current(html_path: Path, test_file: Path, deps: dict[str, list[str]] | None) -> bool:
+    """
+    Check whether a page is newer than its test file and every file it read,
+    and none of the files it could not find has appeared since.
+    """
+    if not isinstance(deps, dict):
+        return False
+    if any(Path(p).exists() for p in deps.get('missing', [])):
+        return False
+    try:
+        html_mtime = html_path.stat().st_mtime
+        return all(Path(p).stat().st_mtime <= html_mtime for p in [test_file, *deps.get('read', [])])
+    except OSError:
+        return False
+
+
 def _generate_document_pages(
     input_path: Path,
     output_path: Path,
@@ -866,13 +1107,16 @@ def _generate_swagger_pages(
 
             # Check if this has API paths or is schema-only
             if has_api_paths(swagger_data):
-                # Use Redoc for API documentation
-                html_content = generate_swagger_html(
-                    swagger_data=swagger_data,
-                    title=api_doc['name'],
-                    all_tests_nav=all_tests_nav,
-                    current_doc_path=html_rel_path
-                )
+                # Use Redoc for API documentation, streamed straight to disk
+                # since the embedded spec can be large
+                with open(output_doc_path, 'w', encoding='utf-8') as f:
+                    generate_swagger_html(
+                        swagger_data=swagger_data,
+                        title=api_doc['name'],
+                        all_tests_nav=all_tests_nav,
+                        current_doc_path=html_rel_path,
+                        out=f
+                    )
             else:
                 # Use schema HTML for schema-only files (e.g., DB models)
                 html_content = generate_schema_html(
@@ -886,8 +1130,8 @@ def _generate_swagger_pages(
                     schema_files_by_category[category] = []
                 schema_files_by_category[category].append(api_doc)
 
-            with open(output_doc_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+                with open(output_doc_path, 'w', encoding='utf-8') as f:
+                    f.write(html_content)
 
             print(f"    Generated: {output_doc_path}")
 
@@ -895,6 +1139,7 @@ def _generate_swagger_pages(
             print(f"    Error processing API doc {api_doc.get('name', 'unknown')}: {e}")
 
     # Generate ER diagrams for each schema category
+    erd_assets_written = False
     for category, schema_files in schema_files_by_category.items():
         if not schema_files:
             continue
@@ -905,17 +1150,21 @@ def _generate_swagger_pages(
             output_erd_path = output_path / erd_path
             output_erd_path.parent.mkdir(parents=True, exist_ok=True)
 
-            erd_html = generate_erd_html(
-                schema_files=schema_files,
-                title=f"{category.upper()} ER Diagram",
-                current_doc_path=erd_path,
-                category_docs=category_docs
-            )
-
             with open(output_erd_path, 'w', encoding='utf-8') as f:
-                f.write(erd_html)
+                generate_erd_html(
+                    schema_files=schema_files,
+                    title=f"{category.upper()} ER Diagram",
+                    current_doc_path=erd_path,
+                    category_docs=category_docs,
+                    out=f
+                )
 
             print(f"    Generated: {output_erd_path} (ER Diagram)")
 
+            # Shared stylesheet linked from every ER diagram page
+            if not erd_assets_written:
+                write_erd_assets(output_path)
+                erd_assets_written = True
+
         except Exception as e:
             print(f"    Error generating ER diagram for {category}: {e}")
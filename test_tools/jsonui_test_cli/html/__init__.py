@@ -4,6 +4,7 @@ from .styles import (
     get_screen_styles,
     get_flow_styles,
     get_index_styles,
+    write_style_assets,
 )
 from .sidebar import (
     generate_screen_sidebar,
@@ -15,6 +16,7 @@ from .flow import generate_flow_html
 from .index import generate_index_html
 from .document import generate_document_html
 from .swagger import (
+    load_swagger_file,
     is_swagger_file,
     parse_swagger_file,
     generate_swagger_html,
@@ -23,12 +25,13 @@ from .schema import (
     has_api_paths,
     generate_schema_html,
 )
-from .erd import generate_erd_html
+from .erd import generate_erd_html, write_erd_assets
 
 __all__ = [
     "get_screen_styles",
     "get_flow_styles",
     "get_index_styles",
+    "write_style_assets",
     "generate_screen_sidebar",
     "generate_flow_sidebar",
     "generate_index_sidebar",
@@ -36,10 +39,12 @@ __all__ = [
     "generate_flow_html",
     "generate_index_html",
     "generate_document_html",
+    "load_swagger_file",
     "is_swagger_file",
     "parse_swagger_file",
     "generate_swagger_html",
     "has_api_paths",
     "generate_schema_html",
     "generate_erd_html",
+    "write_erd_assets",
 ]
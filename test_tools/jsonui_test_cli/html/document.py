@@ -210,7 +210,7 @@ def generate_document_html(
     html_parts.append("  </main>")
 
     # Close HTML with Mermaid initialization
-    html_parts.extend(get_toggle_script())
+    html_parts.append(get_toggle_script())
     html_parts.extend(_get_mermaid_script())
     html_parts.extend([
         "</body>",
@@ -346,7 +346,7 @@ def _get_html_header(title: str, additional_styles: str = "") -> list[str]:
         f"  <title>{escape_html(title)}</title>",
         "  <style>",
     ]
-    parts.extend(get_screen_styles())
+    parts.append(get_screen_styles())
     # Add minimal document-specific styles (main layout comes from screen styles)
     parts.extend([
         "    /* Document-specific styles */",
@@ -2,13 +2,60 @@
 
 from __future__ import annotations
 
-import json
-from datetime import datetime
+import io
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, TextIO
 
 from .styles import get_flow_styles, get_toggle_script
-from .sidebar import generate_flow_sidebar, escape_html
+from .sidebar import generate_flow_sidebar, escape_html, generated_timestamp, step_target
+
+# Static markup for each step kind, filled with str.format at render time
+_FILE_REF_TMPL = """    <div class='flow-step file-ref' id='{step_id}'>
+      <div class='step-header'>
+        <span class='step-number'>{num}</span>
+        <span class='step-type-badge file'>File Reference</span>
+      </div>
+      <div class='step-content'>
+        <div class='step-detail'><strong>File:</strong> <code>{file_ref}</code></div>
+"""
+
+_FILE_ARG_TMPL = "            <li><code>@{{{key}}}</code> = <code>{value}</code></li>\n"
+
+_BLOCK_TMPL = """    <div class='flow-step block-step' id='{step_id}'>
+      <div class='step-header'>
+        <span class='step-number'>{num}</span>
+        <span class='step-type-badge block'>Block</span>
+        <span class='block-title'>{title}</span>
+      </div>
+      <div class='step-content'>
+        <div class='step-detail'><strong>Block Name:</strong> <code>{block_name}</code></div>
+"""
+
+_BLOCK_STEPS_TMPL = """        <div class='block-steps'>
+          <div class='block-steps-header'>Steps ({count})</div>
+          <table>
+            <tr><th>#</th><th>Type</th><th>Action/Assert</th><th>Target</th><th>Details</th></tr>
+{rows}          </table>
+        </div>
+"""
+
+# Block table rows, with the type cell baked in for actions and assertions
+_BLOCK_ACTION_ROW_TMPL = "            <tr><td>{num}</td><td><span class='action'>Action</span></td><td><code>{action}</code></td><td><code>{target}</code></td><td>{details}</td></tr>\n"
+_BLOCK_ASSERT_ROW_TMPL = "            <tr><td>{num}</td><td><span class='assert'>Assert</span></td><td><code>{action}</code></td><td><code>{target}</code></td><td>{details}</td></tr>\n"
+
+_INLINE_STEP_TMPL = """    <div class='flow-step inline-{step_type}' id='{step_id}'>
+      <div class='step-header'>
+        <span class='step-type-badge {step_type}'>{type_label}</span>
+        <code class='inline-step-action'>{action}</code>
+        <span class='inline-step-target'>-> <code>{target}</code></span>
+{details}      </div>
+    </div>
+"""
+
+_INLINE_DETAILS_TMPL = "        <span class='inline-step-details'>({details})</span>\n"
+
+# Appended to checkpoints that take a screenshot
+_SCREENSHOT_ICON = " 📷"
 
 
 def generate_flow_html(
@@ -22,8 +69,12 @@ def generate_flow_html(
     resolve_block_description_fn=None,
     format_block_description_html_fn=None,
     all_tests_nav: dict | None = None,
-    current_test_path: str | None = None
-) -> str:
+    current_test_path: str | None = None,
+    out: TextIO | None = None,
+    stylesheet_href: str | None = None,
+    nav_items: dict[str, str] | None = None,
+    generated_at: str | None = None
+) -> str | None:
     """
     Generate HTML documentation for flow tests.
 
@@ -39,9 +90,13 @@ def generate_flow_html(
         format_block_description_html_fn: Function to format block description as HTML (optional)
         all_tests_nav: Navigation data {'screens': [...], 'flows': [...]}
         current_test_path: Current test's relative HTML path
+        out: Optional text stream to write the page to instead of returning it
+        stylesheet_href: Stylesheet to link instead of inlining the page styles
+        nav_items: Navigation list items pre-rendered once for the whole build
+        generated_at: "Generated:" timestamp shared by the whole build (default: now)
 
     Returns:
-        Complete HTML string
+        Complete HTML string, or None if written to out
     """
     metadata = data.get("metadata", {})
     name = metadata.get("name", file_path.stem)
@@ -52,21 +107,21 @@ def generate_flow_html(
     teardown_steps = data.get("teardown", [])
     checkpoints = data.get("checkpoints", [])
 
-    # Build sidebar data (file references and blocks, not inline action/assert)
-    # Only file references and blocks get numbered
+    # Build sidebar data (file references and blocks, not inline action/assert).
+    # Only file references and blocks get numbered. Block descriptions are
+    # resolved here once and reused when the step is rendered.
     sidebar_steps = []
+    step_nums = []
+    resolved_descs = []
     numbered_step_num = 0
     for step in steps:
+        step_num = None
+        resolved_desc = None
         if "file" in step:
             numbered_step_num += 1
-            # File reference - get label from referenced case description
-            file_ref = step.get("file", "")
-            case_name = step.get("case")
-            cases_list = step.get("cases")
-
+            step_num = numbered_step_num
             # Get label from referenced file's case description
-            label = get_ref_case_label_fn(file_ref, case_name, cases_list)
-
+            label = get_ref_case_label_fn(step.get("file", ""), step.get("case"), step.get("cases"))
             sidebar_steps.append({
                 "num": numbered_step_num,
                 "type": "file",
@@ -75,122 +130,113 @@ def generate_flow_html(
             })
         elif "block" in step:
             numbered_step_num += 1
+            step_num = numbered_step_num
             # Block step - show in sidebar with description or block name
-            block_name = step.get("block", "")
             block_desc = step.get("description", "")
-
-            # Try to get description from descriptionFile if present
-            if resolve_block_description_fn and "descriptionFile" in step:
+            if resolve_block_description_fn:
                 resolved_desc = resolve_block_description_fn(step)
                 if isinstance(resolved_desc, dict) and resolved_desc.get("summary"):
                     block_desc = resolved_desc["summary"]
 
-            label = block_desc or block_name
             sidebar_steps.append({
                 "num": numbered_step_num,
                 "type": "block",
-                "label": label,
+                "label": block_desc or step.get("block", ""),
                 "detail": ""
             })
         # Inline steps (action/assert) are not shown in sidebar and not numbered
+        step_nums.append(step_num)
+        resolved_descs.append(resolved_desc)
 
     # Build HTML
-    html_parts = _get_html_header(title, name)
-    html_parts.extend(generate_flow_sidebar(name, sidebar_steps, checkpoints, all_tests_nav, current_test_path))
-
-    # Main content wrapper
-    html_parts.append("  <main class='main-content'>")
-    html_parts.append(f"    <h1>{escape_html(title)}</h1>")
-    html_parts.append(f"    <p class='test-name-label'><strong>Flow Name:</strong> <code>{escape_html(name)}</code></p>")
-
-    # Test info
-    html_parts.append("    <div class='info'>")
-    html_parts.append(f"      <strong>Type:</strong> flow<br>")
-    html_parts.append(f"      <strong>Platform:</strong> {data.get('platform', 'all')}<br>")
-    html_parts.append(f"      <strong>Steps:</strong> {len(steps)}<br>")
+    buf = io.StringIO() if out is None else None
+    w = buf.write if out is None else out.write
+    w("\n".join(_get_html_header(title, name, stylesheet_href)))
+    w("\n")
+    w(generate_flow_sidebar(name, sidebar_steps, checkpoints, all_tests_nav, current_test_path, nav_items))
+
+    # Main content wrapper and test info
+    w(f"""
+  <main class='main-content'>
+    <h1>{escape_html(title)}</h1>
+    <p class='test-name-label'><strong>Flow Name:</strong> <code>{escape_html(name)}</code></p>
+    <div class='info'>
+      <strong>Type:</strong> flow<br>
+      <strong>Platform:</strong> {data.get('platform', 'all')}<br>
+      <strong>Steps:</strong> {len(steps)}<br>
+""")
     if setup_steps:
-        html_parts.append(f"      <strong>Setup:</strong> {len(setup_steps)} steps<br>")
+        w(f"      <strong>Setup:</strong> {len(setup_steps)} steps<br>\n")
     if teardown_steps:
-        html_parts.append(f"      <strong>Teardown:</strong> {len(teardown_steps)} steps<br>")
+        w(f"      <strong>Teardown:</strong> {len(teardown_steps)} steps<br>\n")
     if checkpoints:
-        html_parts.append(f"      <strong>Checkpoints:</strong> {len(checkpoints)}<br>")
-    html_parts.append(f"      <strong>Generated:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    html_parts.append("    </div>")
+        w(f"      <strong>Checkpoints:</strong> {len(checkpoints)}<br>\n")
+    w(f"      <strong>Generated:</strong> {generated_at or generated_timestamp()}\n")
+    w("    </div>\n")
 
     # Setup section
     if setup_steps:
-        html_parts.append("    <h2>Setup</h2>")
-        html_parts.append("    <div class='setup-teardown'>")
+        w("    <h2>Setup</h2>\n    <div class='setup-teardown'>\n")
         for i, step in enumerate(setup_steps, 1):
-            html_parts.extend(_render_flow_step(
-                i, step, "setup", format_step_details_fn, render_referenced_cases_fn,
+            _render_flow_step(
+                w, i, step, "setup", format_step_details_fn, render_referenced_cases_fn,
                 resolve_block_description_fn, format_block_description_html_fn
-            ))
-        html_parts.append("    </div>")
+            )
+        w("    </div>\n")
 
     # Flow Steps
-    html_parts.append("    <h2>Flow Steps</h2>")
-    numbered_step_num = 0
-    for step in steps:
-        # Only file references and blocks get numbered
-        if "file" in step or "block" in step:
-            numbered_step_num += 1
-            html_parts.extend(_render_flow_step(
-                numbered_step_num, step, "step", format_step_details_fn, render_referenced_cases_fn,
-                resolve_block_description_fn, format_block_description_html_fn
-            ))
-        else:
-            # Inline action/assert - no number
-            html_parts.extend(_render_flow_step(
-                None, step, "step", format_step_details_fn, render_referenced_cases_fn,
-                resolve_block_description_fn, format_block_description_html_fn
-            ))
+    w("    <h2>Flow Steps</h2>\n")
+    for step, step_num, resolved_desc in zip(steps, step_nums, resolved_descs):
+        _render_flow_step(
+            w, step_num, step, "step", format_step_details_fn, render_referenced_cases_fn,
+            resolve_block_description_fn, format_block_description_html_fn, resolved_desc
+        )
 
     # Teardown section
     if teardown_steps:
-        html_parts.append("    <h2>Teardown</h2>")
-        html_parts.append("    <div class='setup-teardown'>")
+        w("    <h2>Teardown</h2>\n    <div class='setup-teardown'>\n")
         for i, step in enumerate(teardown_steps, 1):
-            html_parts.extend(_render_flow_step(
-                i, step, "teardown", format_step_details_fn, render_referenced_cases_fn,
+            _render_flow_step(
+                w, i, step, "teardown", format_step_details_fn, render_referenced_cases_fn,
                 resolve_block_description_fn, format_block_description_html_fn
-            ))
-        html_parts.append("    </div>")
+            )
+        w("    </div>\n")
 
     # Checkpoints section
     if checkpoints:
-        html_parts.append("    <h2>Checkpoints</h2>")
-        html_parts.append("    <ul class='checkpoint-list'>")
-        for cp in checkpoints:
-            cp_name = cp.get("name", "unnamed")
-            after_step = cp.get("afterStep", 0)
-            has_screenshot = cp.get("screenshot", False)
-            screenshot_icon = " 📷" if has_screenshot else ""
-            html_parts.append(f"      <li><strong>{escape_html(cp_name)}</strong> (after step {after_step + 1}){screenshot_icon}</li>")
-        html_parts.append("    </ul>")
+        w("    <h2>Checkpoints</h2>\n    <ul class='checkpoint-list'>\n")
+        w("".join([
+            f"      <li><strong>{escape_html(cp.get('name', 'unnamed'))}</strong>"
+            f" (after step {cp.get('afterStep', 0) + 1}){_SCREENSHOT_ICON if cp.get('screenshot') else ''}</li>\n"
+            for cp in checkpoints
+        ]))
+        w("    </ul>\n")
 
-    html_parts.append("  </main>")
-    html_parts.append("</body>")
-    html_parts.append("</html>")
+    w("  </main>\n</body>\n</html>")
 
-    return "\n".join(html_parts)
+    if out is None:
+        return buf.getvalue()
+    return None
 
 
 def _render_flow_step(
+    w: Callable[[str], Any],
     num: int | None,
     step: dict,
     context: str,
     format_step_details_fn,
     render_referenced_cases_fn,
     resolve_block_description_fn=None,
-    format_block_description_html_fn=None
-) -> list[str]:
+    format_block_description_html_fn=None,
+    resolved_desc: dict | str | None = None
+) -> None:
     """Render a single flow step as HTML.
 
     Args:
+        w: Write function receiving newline-terminated HTML chunks
         num: Step number (None for inline action/assert steps that shouldn't be numbered)
+        resolved_desc: Block description already resolved by the caller (optional)
     """
-    parts = []
     step_id = f"{context}-{num}" if num else f"{context}-inline"
 
     if "file" in step:
@@ -199,40 +245,33 @@ def _render_flow_step(
         case_name = step.get("case")
         cases = step.get("cases")
 
-        parts.append(f"    <div class='flow-step file-ref' id='{step_id}'>")
-        parts.append(f"      <div class='step-header'>")
-        parts.append(f"        <span class='step-number'>{num}</span>")
-        parts.append(f"        <span class='step-type-badge file'>File Reference</span>")
-        parts.append(f"      </div>")
-        parts.append(f"      <div class='step-content'>")
-        parts.append(f"        <div class='step-detail'><strong>File:</strong> <code>{escape_html(file_ref)}</code></div>")
+        w(_FILE_REF_TMPL.format(step_id=step_id, num=num, file_ref=escape_html(file_ref)))
 
         if case_name:
-            parts.append(f"        <div class='step-detail'><strong>Case:</strong> <code>{escape_html(case_name)}</code></div>")
+            w(f"        <div class='step-detail'><strong>Case:</strong> <code>{escape_html(case_name)}</code></div>\n")
         elif cases:
             cases_str = ", ".join(cases)
-            parts.append(f"        <div class='step-detail'><strong>Cases:</strong> <code>{escape_html(cases_str)}</code></div>")
+            w(f"        <div class='step-detail'><strong>Cases:</strong> <code>{escape_html(cases_str)}</code></div>\n")
         else:
-            parts.append(f"        <div class='step-detail'><strong>Cases:</strong> <em>all cases</em></div>")
+            w("        <div class='step-detail'><strong>Cases:</strong> <em>all cases</em></div>\n")
 
         # Display args if present
         step_args = step.get("args", {})
         if step_args:
-            parts.append(f"        <div class='step-args'>")
-            parts.append(f"          <strong>Args (Override):</strong>")
-            parts.append(f"          <ul>")
-            for arg_key, arg_value in step_args.items():
-                parts.append(f"            <li><code>@{{{arg_key}}}</code> = <code>{escape_html(str(arg_value))}</code></li>")
-            parts.append(f"          </ul>")
-            parts.append(f"        </div>")
+            w("        <div class='step-args'>\n          <strong>Args (Override):</strong>\n          <ul>\n")
+            w("".join([
+                _FILE_ARG_TMPL.format(key=arg_key, value=escape_html(str(arg_value)))
+                for arg_key, arg_value in step_args.items()
+            ]))
+            w("          </ul>\n        </div>\n")
 
         # Load referenced file and show case details
         ref_cases_html = render_referenced_cases_fn(file_ref, case_name, cases)
         if ref_cases_html:
-            parts.extend(ref_cases_html)
+            w("\n".join(ref_cases_html))
+            w("\n")
 
-        parts.append(f"      </div>")
-        parts.append(f"    </div>")
+        w("      </div>\n    </div>\n")
 
     elif "block" in step:
         # Block step - grouped inline steps with description
@@ -241,84 +280,67 @@ def _render_flow_step(
 
         # Resolve description
         block_desc = step.get("description", "")
-        resolved_desc = None
-        if resolve_block_description_fn:
+        if resolved_desc is None and resolve_block_description_fn:
             resolved_desc = resolve_block_description_fn(step)
-            if isinstance(resolved_desc, dict) and resolved_desc.get("summary"):
-                block_desc = resolved_desc["summary"]
+        if isinstance(resolved_desc, dict) and resolved_desc.get("summary"):
+            block_desc = resolved_desc["summary"]
 
         display_title = block_desc or block_name
 
-        parts.append(f"    <div class='flow-step block-step' id='{step_id}'>")
-        parts.append(f"      <div class='step-header'>")
-        parts.append(f"        <span class='step-number'>{num}</span>")
-        parts.append(f"        <span class='step-type-badge block'>Block</span>")
-        parts.append(f"        <span class='block-title'>{escape_html(display_title)}</span>")
-        parts.append(f"      </div>")
-        parts.append(f"      <div class='step-content'>")
-        parts.append(f"        <div class='step-detail'><strong>Block Name:</strong> <code>{escape_html(block_name)}</code></div>")
+        w(_BLOCK_TMPL.format(
+            step_id=step_id, num=num, title=escape_html(display_title), block_name=escape_html(block_name)
+        ))
 
         # Render block description (similar to case description)
         if format_block_description_html_fn and resolved_desc:
             desc_html = format_block_description_html_fn(resolved_desc)
             if desc_html:
-                parts.extend(desc_html)
+                w("\n".join(desc_html))
+                w("\n")
 
         # Render block steps as table (same as screen test case steps)
         if block_steps:
-            parts.append(f"        <div class='block-steps'>")
-            parts.append(f"          <div class='block-steps-header'>Steps ({len(block_steps)})</div>")
-            parts.append(f"          <table>")
-            parts.append(f"            <tr><th>#</th><th>Type</th><th>Action/Assert</th><th>Target</th><th>Details</th></tr>")
-            for j, inner_step in enumerate(block_steps, 1):
-                step_type = "action" if "action" in inner_step else "assert"
-                type_label = "Action" if step_type == "action" else "Assert"
-                action_name = inner_step.get("action") or inner_step.get("assert", "?")
-                target = inner_step.get("id") or ", ".join(inner_step.get("ids", [])) or "-"
-                details = format_step_details_fn(inner_step)
-                parts.append(f"            <tr><td>{j}</td><td><span class='{step_type}'>{type_label}</span></td><td><code>{escape_html(action_name)}</code></td><td><code>{escape_html(target)}</code></td><td>{escape_html(details) if details else ''}</td></tr>")
-            parts.append(f"          </table>")
-            parts.append(f"        </div>")
-
-        parts.append(f"      </div>")
-        parts.append(f"    </div>")
-
-    elif "action" in step:
-        # Inline action
-        action = step.get("action", "?")
-        target = step.get("id") or ", ".join(step.get("ids", [])) or "-"
-        details = format_step_details_fn(step)
-
-        parts.append(f"    <div class='flow-step inline-action' id='{step_id}'>")
-        parts.append(f"      <div class='step-header'>")
-        parts.append(f"        <span class='step-type-badge action'>Action</span>")
-        parts.append(f"        <code class='inline-step-action'>{escape_html(action)}</code>")
-        parts.append(f"        <span class='inline-step-target'>-> <code>{escape_html(target)}</code></span>")
-        if details:
-            parts.append(f"        <span class='inline-step-details'>({escape_html(details)})</span>")
-        parts.append(f"      </div>")
-        parts.append(f"    </div>")
-
-    elif "assert" in step:
-        # Inline assertion
-        assertion = step.get("assert", "?")
-        target = step.get("id") or ", ".join(step.get("ids", [])) or "-"
+            rows = "".join([
+                _render_block_row(j, inner_step, format_step_details_fn)
+                for j, inner_step in enumerate(block_steps, 1)
+            ])
+            w(_BLOCK_STEPS_TMPL.format(count=len(block_steps), rows=rows))
+
+        w("      </div>\n    </div>\n")
+
+    elif "action" in step or "assert" in step:
+        # Inline action or assertion
+        if "action" in step:
+            step_type, type_label, action = "action", "Action", step.get("action", "?")
+        else:
+            step_type, type_label, action = "assert", "Assert", step.get("assert", "?")
+        target = step_target(step)
         details = format_step_details_fn(step)
 
-        parts.append(f"    <div class='flow-step inline-assert' id='{step_id}'>")
-        parts.append(f"      <div class='step-header'>")
-        parts.append(f"        <span class='step-type-badge assert'>Assert</span>")
-        parts.append(f"        <code class='inline-step-action'>{escape_html(assertion)}</code>")
-        parts.append(f"        <span class='inline-step-target'>-> <code>{escape_html(target)}</code></span>")
-        if details:
-            parts.append(f"        <span class='inline-step-details'>({escape_html(details)})</span>")
-        parts.append(f"      </div>")
-        parts.append(f"    </div>")
-
-    return parts
-
-
-def _get_html_header(title: str, name: str) -> list[str]:
+        w(_INLINE_STEP_TMPL.format(
+            step_type=step_type,
+            step_id=step_id,
+            type_label=type_label,
+            action=escape_html(action),
+            target=escape_html(target),
+            details=_INLINE_DETAILS_TMPL.format(details=escape_html(details)) if details else "",
+        ))
+
+
+def _render_block_row(num: int, inner_step: dict, format_step_details_fn) -> str:
+    """Render one row of a block's steps table."""
+    tmpl = _BLOCK_ACTION_ROW_TMPL if "action" in inner_step else _BLOCK_ASSERT_ROW_TMPL
+    action_name = inner_step.get("action") or inner_step.get("assert", "?")
+    details = format_step_details_fn(inner_step)
+    return tmpl.format(
+        num=num,
+        action=escape_html(action_name),
+        target=escape_html(step_target(inner_step)),
+        details=escape_html(details) if details else "",
+    )
+
+
+def _get_html_header(title: str, name: str, stylesheet_href: str | None = None) -> list[str]:
     """Get HTML header with styles for flow test pages."""
     parts = [
         "<!DOCTYPE html>",
@@ -327,11 +349,12 @@ def _get_html_header(title: str, name: str) -> list[str]:
         f"  <title>{escape_html(title)} - Flow Test Documentation</title>",
         "  <meta charset='utf-8'>",
         "  <meta name='viewport' content='width=device-width, initial-scale=1'>",
-        "  <style>",
     ]
-    parts.extend(get_flow_styles())
-    parts.append("  </style>")
-    parts.extend(get_toggle_script())
+    if stylesheet_href is None:
+        parts.extend(["  <style>", get_flow_styles(), "  </style>"])
+    else:
+        parts.append(f"  <link rel='stylesheet' href='{stylesheet_href}'>")
+    parts.append(get_toggle_script())
     parts.extend([
         "</head>",
         "<body>",
@@ -2,11 +2,73 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
+from typing import Any
 
 from .styles import get_index_styles, get_index_scripts
-from .sidebar import generate_index_sidebar, escape_html
+from .sidebar import generate_index_sidebar, escape_html, generated_timestamp
+
+# Fields read from each generated file info dict, in template order
+_FLOW_COLUMNS = itemgetter('path', 'name', 'platform', 'step_count', 'description')
+_SCREEN_COLUMNS = itemgetter('path', 'name', 'platform', 'case_count', 'step_count', 'description')
+_OTHER_COLUMNS = itemgetter('path', 'name', 'type', 'platform', 'description')
+
+# List item markup per category, filled with str.format for each file
+_FLOW_ITEM_TMPL = """          <li class='test-item flow'>
+            <a href='{path}' class='test-name'>{name}</a>
+            <div class='test-meta'>
+              {platform_badge}
+              {step_count} steps
+            </div>
+{description}          </li>
+"""
+
+_SCREEN_ITEM_TMPL = """          <li class='test-item screen'>
+            <a href='{path}' class='test-name'>{name}</a>
+            <div class='test-meta'>
+              {platform_badge}
+              {case_count} cases, {step_count} steps
+            </div>
+{description}          </li>
+"""
+
+_OTHER_ITEM_TMPL = """          <li class='test-item'>
+            <a href='{path}' class='test-name'>{name}</a>
+            <div class='test-meta'>
+              {type_badge}
+              {platform_badge}
+            </div>
+{description}          </li>
+"""
+
+_CATEGORY_TMPL = """    <div class='category'>
+      <div class='category-header collapsed' id='{category_id}-header' onclick="toggleCategory('{category_id}')">
+        <h2><span class='arrow'>▼</span> {label} <span class='{badge_class}'>{count}</span></h2>
+      </div>
+      <div class='category-content collapsed' id='{category_id}-content'>
+{content}      </div>
+    </div>
+"""
+
+_ERD_LINK_TMPL = """        <div class='erd-link-container'>
+          <a href='{category_name}/erd.html' class='erd-link'>
+            <span class='erd-icon'>📊</span>
+            <span class='erd-text'>View ER Diagram</span>
+            <span class='erd-desc'>Table relationships visualization</span>
+          </a>
+        </div>
+"""
+
+_DOC_ITEM_TMPL = """          <li class='test-item doc'>
+            <a href='{path}' class='test-name'>{name}</a>
+          </li>
+"""
+
+_API_ITEM_TMPL = """          <li class='test-item api'>
+            <a href='{path}' class='test-name'>{name}</a>
+{description}          </li>
+"""
 
 
 def generate_index_html(
@@ -15,7 +77,8 @@ def generate_index_html(
     title: str,
     has_mermaid_diagram: bool = False,
     document_files: list[dict] | None = None,
-    api_doc_categories: dict[str, list[dict]] | None = None
+    api_doc_categories: dict[str, list[dict]] | None = None,
+    generated_at: str | None = None
 ) -> None:
     """
     Generate index.html with collapsible categories and sidebar navigation.
@@ -27,234 +90,190 @@ def generate_index_html(
         has_mermaid_diagram: Whether a Mermaid diagram was generated
         document_files: List of document file dicts
         api_doc_categories: Dict of category name -> list of API doc file dicts
+        generated_at: "Generated:" timestamp shared by the whole build (default: now)
     """
-    screen_files = [f for f in files if f['type'] == 'screen']
-    flow_files = [f for f in files if f['type'] == 'flow']
-    other_files = [f for f in files if f['type'] not in ['screen', 'flow']]
+    # Classify and total in a single pass over files
+    screen_files: list[dict] = []
+    flow_files: list[dict] = []
+    other_files: list[dict] = []
+    total_cases = total_steps = 0
+    for f in files:
+        file_type = f['type']
+        if file_type == 'screen':
+            screen_files.append(f)
+        elif file_type == 'flow':
+            flow_files.append(f)
+        else:
+            other_files.append(f)
+        total_cases += f['case_count']
+        total_steps += f['step_count']
 
     screen_count = len(screen_files)
     flow_count = len(flow_files)
     doc_count = len(document_files) if document_files else 0
-    # Count all API docs across categories
-    api_doc_count = sum(len(docs) for docs in (api_doc_categories or {}).values())
-    total_cases = sum(f['case_count'] for f in files)
-    total_steps = sum(f['step_count'] for f in files)
-
-    html_parts = _get_html_header(title)
-    html_parts.extend(generate_index_sidebar(title, flow_files, screen_files, has_mermaid_diagram, document_files, api_doc_categories))
-
-    # Main content
-    html_parts.append("  <main class='main-content'>")
-    html_parts.append(f"    <h1>{escape_html(title)}</h1>")
-
-    # Flow Diagram link (if available)
-    if has_mermaid_diagram:
-        html_parts.extend([
-            "    <div class='diagram-link-container'>",
-            "      <a href='diagram.html' class='diagram-link'>",
-            "        <span class='diagram-icon'>📊</span>",
-            "        <span class='diagram-text'>View Flow Diagram</span>",
-            "        <span class='diagram-desc'>Screen transition visualization</span>",
-            "      </a>",
-            "    </div>",
-        ])
-
-    # Summary section
-    html_parts.extend([
-        "    <div class='summary'>",
-        "      <div class='summary-item'>",
-        f"        <div class='summary-value'>{len(files)}</div>",
-        "        <div class='summary-label'>Test Files</div>",
-        "      </div>",
-        "      <div class='summary-item'>",
-        f"        <div class='summary-value'>{screen_count}</div>",
-        "        <div class='summary-label'>Screen Tests</div>",
-        "      </div>",
-        "      <div class='summary-item'>",
-        f"        <div class='summary-value'>{flow_count}</div>",
-        "        <div class='summary-label'>Flow Tests</div>",
-        "      </div>",
-        "      <div class='summary-item'>",
-        f"        <div class='summary-value'>{total_cases}</div>",
-        "        <div class='summary-label'>Test Cases</div>",
-        "      </div>",
-        "      <div class='summary-item'>",
-        f"        <div class='summary-value'>{total_steps}</div>",
-        "        <div class='summary-label'>Total Steps</div>",
-        "      </div>",
-        "    </div>",
-    ])
 
-    # Flow Tests category first (collapsible, starts collapsed)
-    if flow_files:
-        html_parts.extend([
-            "    <div class='category'>",
-            "      <div class='category-header collapsed' id='flows-header' onclick=\"toggleCategory('flows')\">",
-            f"        <h2><span class='arrow'>▼</span> Flow Tests <span class='category-badge flow'>{flow_count}</span></h2>",
-            "      </div>",
-            "      <div class='category-content collapsed' id='flows-content'>",
-            "        <ul class='test-list'>",
-        ])
-        for f in flow_files:
-            html_parts.extend([
-                "          <li class='test-item flow'>",
-                f"            <a href='{f['path']}' class='test-name'>{escape_html(f['name'])}</a>",
-                "            <div class='test-meta'>",
-                f"              <span class='badge badge-platform'>{f['platform']}</span>",
-                f"              {f['step_count']} steps",
-                "            </div>",
-            ])
-            if f['description']:
-                html_parts.append(f"            <div class='test-description'>{escape_html(f['description'])}</div>")
-            html_parts.append("          </li>")
-        html_parts.extend([
-            "        </ul>",
-            "      </div>",
-            "    </div>",
-        ])
-
-    # Screen Tests category (collapsible, starts collapsed)
-    if screen_files:
-        html_parts.extend([
-            "    <div class='category'>",
-            "      <div class='category-header collapsed' id='screens-header' onclick=\"toggleCategory('screens')\">",
-            f"        <h2><span class='arrow'>▼</span> Screen Tests <span class='category-badge screen'>{screen_count}</span></h2>",
-            "      </div>",
-            "      <div class='category-content collapsed' id='screens-content'>",
-            "        <ul class='test-list'>",
-        ])
-        for f in screen_files:
-            html_parts.extend([
-                "          <li class='test-item screen'>",
-                f"            <a href='{f['path']}' class='test-name'>{escape_html(f['name'])}</a>",
-                "            <div class='test-meta'>",
-                f"              <span class='badge badge-platform'>{f['platform']}</span>",
-                f"              {f['case_count']} cases, {f['step_count']} steps",
-                "            </div>",
-            ])
-            if f['description']:
-                html_parts.append(f"            <div class='test-description'>{escape_html(f['description'])}</div>")
-            html_parts.append("          </li>")
-        html_parts.extend([
-            "        </ul>",
-            "      </div>",
-            "    </div>",
-        ])
-
-    # Documents category (collapsible, starts collapsed)
-    if document_files:
-        html_parts.extend([
-            "    <div class='category'>",
-            "      <div class='category-header collapsed' id='documents-header' onclick=\"toggleCategory('documents')\">",
-            f"        <h2><span class='arrow'>▼</span> Documents <span class='category-badge doc'>{doc_count}</span></h2>",
-            "      </div>",
-            "      <div class='category-content collapsed' id='documents-content'>",
-            "        <ul class='test-list'>",
-        ])
-        for d in document_files:
-            html_parts.extend([
-                "          <li class='test-item doc'>",
-                f"            <a href='{d['path']}' class='test-name'>{escape_html(d['name'])}</a>",
-                "          </li>",
-            ])
-        html_parts.extend([
-            "        </ul>",
-            "      </div>",
-            "    </div>",
-        ])
-
-    # API Docs categories (one section per directory, collapsible, starts collapsed)
-    if api_doc_categories:
-        for category_name, category_docs in api_doc_categories.items():
-            # Format category name for display (e.g., "api" -> "API", "db" -> "DB")
-            display_name = category_name.upper() if len(category_name) <= 3 else category_name.title()
-            category_id = f"api-{category_name}"
+    # Bound once for the per-item loops below
+    esc = escape_html
+    describe = _description_html
+    # Only a handful of platforms and types occur, so render each badge once
+    platform_badges = _badge_map([f['platform'] for f in files], "badge badge-platform")
+    type_badges = _badge_map([f['type'] for f in other_files], "badge")
+
+    # Stream straight into index.html rather than assembling the page in memory
+    index_path = output_dir / "index.html"
+    with open(index_path, 'w', encoding='utf-8', buffering=1 << 16) as out:
+        w = out.write
+        w("\n".join(_get_html_header(title)))
+        w("\n")
+        w(generate_index_sidebar(title, flow_files, screen_files, has_mermaid_diagram, document_files, api_doc_categories))
+
+        # Main content
+        w(f"""
+  <main class='main-content'>
+    <h1>{escape_html(title)}</h1>
+""")
+
+        # Flow Diagram link (if available)
+        if has_mermaid_diagram:
+            w("""    <div class='diagram-link-container'>
+      <a href='diagram.html' class='diagram-link'>
+        <span class='diagram-icon'>📊</span>
+        <span class='diagram-text'>View Flow Diagram</span>
+        <span class='diagram-desc'>Screen transition visualization</span>
+      </a>
+    </div>
+""")
 
-            # Check if this category has schema-only files (for ER diagram link)
-            has_schema_files = any(
-                not d.get('has_api_paths', True) for d in category_docs
-            )
+        # Summary section
+        w(f"""    <div class='summary'>
+      <div class='summary-item'>
+        <div class='summary-value'>{len(files)}</div>
+        <div class='summary-label'>Test Files</div>
+      </div>
+      <div class='summary-item'>
+        <div class='summary-value'>{screen_count}</div>
+        <div class='summary-label'>Screen Tests</div>
+      </div>
+      <div class='summary-item'>
+        <div class='summary-value'>{flow_count}</div>
+        <div class='summary-label'>Flow Tests</div>
+      </div>
+      <div class='summary-item'>
+        <div class='summary-value'>{total_cases}</div>
+        <div class='summary-label'>Test Cases</div>
+      </div>
+      <div class='summary-item'>
+        <div class='summary-value'>{total_steps}</div>
+        <div class='summary-label'>Total Steps</div>
+      </div>
+    </div>
+""")
 
-            html_parts.extend([
-                "    <div class='category'>",
-                f"      <div class='category-header collapsed' id='{category_id}-header' onclick=\"toggleCategory('{category_id}')\">",
-                f"        <h2><span class='arrow'>▼</span> {display_name} <span class='category-badge api'>{len(category_docs)}</span></h2>",
-                "      </div>",
-                f"      <div class='category-content collapsed' id='{category_id}-content'>",
-            ])
+        # Collapsible categories in display order, all starting collapsed:
+        # (category id, label, badge class, item count, content html)
+        categories = []
 
+        # Flow Tests category first
+        if flow_files:
+            fmt = _FLOW_ITEM_TMPL.format
+            categories.append(('flows', 'Flow Tests', 'category-badge flow', flow_count, _test_list("".join([
+                fmt(
+                    path=path,
+                    name=esc(name),
+                    platform_badge=platform_badges[str(platform)],
+                    step_count=step_count,
+                    description=describe(description),
+                )
+                for path, name, platform, step_count, description in map(_FLOW_COLUMNS, flow_files)
+            ]))))
+
+        # Screen Tests category
+        if screen_files:
+            fmt = _SCREEN_ITEM_TMPL.format
+            categories.append(('screens', 'Screen Tests', 'category-badge screen', screen_count, _test_list("".join([
+                fmt(
+                    path=path,
+                    name=esc(name),
+                    platform_badge=platform_badges[str(platform)],
+                    case_count=case_count,
+                    step_count=step_count,
+                    description=describe(description),
+                )
+                for path, name, platform, case_count, step_count, description in map(_SCREEN_COLUMNS, screen_files)
+            ]))))
+
+        # Documents category
+        if document_files:
+            fmt = _DOC_ITEM_TMPL.format
+            categories.append(('documents', 'Documents', 'category-badge doc', doc_count, _test_list("".join([
+                fmt(path=d['path'], name=esc(d['name']))
+                for d in document_files
+            ]))))
+
+        # API Docs categories (one section per directory)
+        fmt = _API_ITEM_TMPL.format
+        for category_name, category_docs in (api_doc_categories or {}).items():
+            # Format category name for display (e.g., "api" -> "API", "db" -> "DB")
+            display_name = category_name.upper() if len(category_name) <= 3 else category_name.title()
+            content = _test_list("".join([
+                fmt(
+                    path=d['path'],
+                    name=esc(d['name']),
+                    description=describe(d.get('description', '')),
+                )
+                for d in category_docs
+            ]))
             # Add ER Diagram link for DB-like categories (schema-only)
             if category_name.lower() == 'db':
-                html_parts.extend([
-                    "        <div class='erd-link-container'>",
-                    f"          <a href='{category_name}/erd.html' class='erd-link'>",
-                    "            <span class='erd-icon'>📊</span>",
-                    "            <span class='erd-text'>View ER Diagram</span>",
-                    "            <span class='erd-desc'>Table relationships visualization</span>",
-                    "          </a>",
-                    "        </div>",
-                ])
-
-            html_parts.append("        <ul class='test-list'>")
-            for d in category_docs:
-                desc = d.get('description', '')
-                html_parts.extend([
-                    "          <li class='test-item api'>",
-                    f"            <a href='{d['path']}' class='test-name'>{escape_html(d['name'])}</a>",
-                ])
-                if desc:
-                    html_parts.append(f"            <div class='test-description'>{escape_html(desc)}</div>")
-                html_parts.append("          </li>")
-            html_parts.extend([
-                "        </ul>",
-                "      </div>",
-                "    </div>",
-            ])
-
-    # Other Tests category (collapsible, starts collapsed)
-    if other_files:
-        html_parts.extend([
-            "    <div class='category'>",
-            "      <div class='category-header collapsed' id='other-header' onclick=\"toggleCategory('other')\">",
-            f"        <h2><span class='arrow'>▼</span> Other Tests <span class='category-badge'>{len(other_files)}</span></h2>",
-            "      </div>",
-            "      <div class='category-content collapsed' id='other-content'>",
-            "        <ul class='test-list'>",
-        ])
-        for f in other_files:
-            html_parts.extend([
-                "          <li class='test-item'>",
-                f"            <a href='{f['path']}' class='test-name'>{escape_html(f['name'])}</a>",
-                "            <div class='test-meta'>",
-                f"              <span class='badge'>{f['type']}</span>",
-                f"              <span class='badge badge-platform'>{f['platform']}</span>",
-                "            </div>",
-            ])
-            if f['description']:
-                html_parts.append(f"            <div class='test-description'>{escape_html(f['description'])}</div>")
-            html_parts.append("          </li>")
-        html_parts.extend([
-            "        </ul>",
-            "      </div>",
-            "    </div>",
-        ])
-
-    # Footer
-    html_parts.extend([
-        f"    <p class='generated'>Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>",
-        "  </main>",
-        "</body>",
-        "</html>",
-    ])
+                content = _ERD_LINK_TMPL.format(category_name=category_name) + content
+            categories.append((f"api-{category_name}", display_name, 'category-badge api', len(category_docs), content))
 
-    # Write index.html
-    index_path = output_dir / "index.html"
-    with open(index_path, 'w', encoding='utf-8') as f:
-        f.write("\n".join(html_parts))
+        # Other Tests category
+        if other_files:
+            fmt = _OTHER_ITEM_TMPL.format
+            categories.append(('other', 'Other Tests', 'category-badge', len(other_files), _test_list("".join([
+                fmt(
+                    path=path,
+                    name=esc(name),
+                    type_badge=type_badges[str(test_type)],
+                    platform_badge=platform_badges[str(platform)],
+                    description=describe(description),
+                )
+                for path, name, test_type, platform, description in map(_OTHER_COLUMNS, other_files)
+            ]))))
+
+        fmt = _CATEGORY_TMPL.format
+        w("".join([
+            fmt(category_id=category_id, label=label, badge_class=badge_class, count=count, content=content)
+            for category_id, label, badge_class, count, content in categories
+        ]))
+
+        # Footer
+        w(f"""    <p class='generated'>Generated: {generated_at or generated_timestamp()}</p>
+  </main>
+</body>
+</html>""")
 
     print(f"  Generated: {index_path}")
 
 
+def _badge_map(values: list[Any], css_class: str) -> dict[str, str]:
+    """Map each distinct badge value (as a string) to its rendered badge span."""
+    return {v: f"<span class='{css_class}'>{escape_html(v)}</span>" for v in set(map(str, values))}
+
+
+def _test_list(items_html: str) -> str:
+    """Wrap rendered list items in a category's test list."""
+    return f"        <ul class='test-list'>\n{items_html}        </ul>\n"
+
+
+def _description_html(description: str) -> str:
+    """Get the description line for a list item, or an empty string."""
+    if not description:
+        return ""
+    return f"            <div class='test-description'>{escape_html(description)}</div>\n"
+
+
 def _get_html_header(title: str) -> list[str]:
     """Get HTML header with styles for index page."""
     parts = [
@@ -266,9 +285,9 @@ def _get_html_header(title: str) -> list[str]:
         "  <meta name='viewport' content='width=device-width, initial-scale=1'>",
         "  <style>",
     ]
-    parts.extend(get_index_styles())
+    parts.append(get_index_styles())
     parts.append("  </style>")
-    parts.extend(get_index_scripts())
+    parts.append(get_index_scripts())
     parts.extend([
         "</head>",
         "<body>",
@@ -2,12 +2,41 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+import io
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 from .styles import get_screen_styles, get_toggle_script
-from .sidebar import generate_screen_sidebar, escape_html
+from .sidebar import generate_screen_sidebar, escape_html, generated_timestamp, step_target
+
+
+# Static page head, built once at import time; only the <title> varies
+# between screen pages.
+_HTML_HEAD_OPEN = "<!DOCTYPE html>\n<html lang='en'>\n<head>\n  <title>"
+
+_HTML_HEAD_META = (
+    " - Test Documentation</title>\n"
+    "  <meta charset='utf-8'>\n"
+    "  <meta name='viewport' content='width=device-width, initial-scale=1'>\n"
+)
+
+_HTML_HEAD_STYLE = "  <style>\n" + get_screen_styles() + "\n  </style>\n"
+
+_STYLESHEET_LINK_TMPL = "  <link rel='stylesheet' href='{href}'>\n"
+
+_HTML_HEAD_CLOSE = get_toggle_script() + "\n</head>\n<body>"
+
+_HTML_FOOT = "  </main>\n</body>\n</html>"
+
+_STEP_TABLE_HEAD = (
+    "    <table>\n"
+    "      <tr><th>#</th><th>Type</th><th>Action/Assert</th><th>Target</th><th>Details</th></tr>\n"
+)
+
+_STEP_ROW_TMPL = (
+    "      <tr><td>{num}</td><td><span class='{step_type}'>{type_label}</span></td>"
+    "<td><code>{action_name}</code></td><td><code>{target}</code></td><td>{details}</td></tr>\n"
+)
 
 
 def generate_screen_html(
@@ -17,8 +46,12 @@ def generate_screen_html(
     format_description_html_fn,
     format_step_details_fn,
     all_tests_nav: dict | None = None,
-    current_test_path: str | None = None
-) -> str:
+    current_test_path: str | None = None,
+    out: TextIO | None = None,
+    stylesheet_href: str | None = None,
+    nav_items: dict[str, str] | None = None,
+    generated_at: str | None = None
+) -> str | None:
     """
     Generate HTML documentation for screen tests.
 
@@ -30,9 +63,13 @@ def generate_screen_html(
         format_step_details_fn: Function to format step details
         all_tests_nav: Navigation data {'screens': [...], 'flows': [...]}
         current_test_path: Current test's relative HTML path
+        out: Optional text stream to write the page to instead of returning it
+        stylesheet_href: Stylesheet to link instead of inlining the page styles
+        nav_items: Navigation list items pre-rendered once for the whole build
+        generated_at: "Generated:" timestamp shared by the whole build (default: now)
 
     Returns:
-        Complete HTML string
+        Complete HTML string, or None if written to out
     """
     metadata = data.get("metadata", {})
     name = metadata.get("name", file_path.stem)
@@ -40,102 +77,112 @@ def generate_screen_html(
     title = description or name
     cases = data.get("cases", [])
 
-    # Pre-compute case display names for sidebar
-    case_displays = []
+    # Resolve each case description once; used by both the sidebar and the body
+    case_descs = []
+    case_summaries = []
     for case in cases:
-        case_name = case.get("name", "Case")
         case_desc = resolve_description_fn(case)
+        case_descs.append(case_desc)
+        # Use description from descriptionFile (summary) or inline description
         if isinstance(case_desc, dict) and case_desc.get("summary"):
-            case_displays.append(case_desc["summary"])
+            case_summaries.append(case_desc["summary"])
         else:
-            case_displays.append(case.get("description") or case_name)
+            case_summaries.append(case.get("description"))
+    case_displays = [
+        summary or case.get("name", "Case")
+        for case, summary in zip(cases, case_summaries)
+    ]
 
     # Build HTML
-    html_parts = _get_html_header(title)
-    html_parts.extend(generate_screen_sidebar(title, case_displays, all_tests_nav, current_test_path))
-
-    # Main content wrapper
-    html_parts.append("  <main class='main-content'>")
-    html_parts.append(f"    <h1>{escape_html(title)}</h1>")
-    html_parts.append(f"    <p class='test-name-label'><strong>Test Name:</strong> <code>{escape_html(name)}</code></p>")
-
-    # Test info
-    html_parts.append("    <div class='info'>")
-    html_parts.append(f"      <strong>Type:</strong> {data.get('type', 'unknown')}<br>")
-    html_parts.append(f"      <strong>Platform:</strong> {data.get('platform', 'all')}<br>")
+    buf = io.StringIO() if out is None else None
+    w = buf.write if out is None else out.write
+    w(_get_html_header(title, stylesheet_href))
+    w("\n")
+    w(generate_screen_sidebar(title, case_displays, all_tests_nav, current_test_path, nav_items))
+
+    # Main content wrapper and test info
+    layout_line = ""
     if "source" in data:
-        html_parts.append(f"      <strong>Layout:</strong> <code>{escape_html(data['source'].get('layout', 'N/A'))}</code><br>")
-    html_parts.append(f"      <strong>Generated:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    html_parts.append("    </div>")
+        layout_line = f"      <strong>Layout:</strong> <code>{escape_html(data['source'].get('layout', 'N/A'))}</code><br>\n"
+    w(f"""
+  <main class='main-content'>
+    <h1>{escape_html(title)}</h1>
+    <p class='test-name-label'><strong>Test Name:</strong> <code>{escape_html(name)}</code></p>
+    <div class='info'>
+      <strong>Type:</strong> {data.get('type', 'unknown')}<br>
+      <strong>Platform:</strong> {data.get('platform', 'all')}<br>
+{layout_line}      <strong>Generated:</strong> {generated_at or generated_timestamp()}
+    </div>
+""")
 
     # Test cases
     if cases:
-        html_parts.append("    <h2>Test Cases</h2>")
+        w("    <h2>Test Cases</h2>\n")
 
-        for i, case in enumerate(cases, 1):
+        for i, (case, case_desc, summary) in enumerate(zip(cases, case_descs, case_summaries), 1):
             case_name = case.get("name", f"Case {i}")
-            case_desc = resolve_description_fn(case)
-            # Use description from descriptionFile (summary) or inline description
-            if isinstance(case_desc, dict) and case_desc.get("summary"):
-                case_display = case_desc["summary"]
-            else:
-                case_display = case.get("description") or case_name
+            case_display = summary or case_name
             case_id = f"case-{i}"
 
-            html_parts.append(f"    <h3 id='{case_id}'>{i}. {escape_html(case_display)}</h3>")
-            html_parts.append(f"    <p class='case-name-label'><strong>Case Name:</strong> <code>{escape_html(case_name)}</code></p>")
+            w(f"""    <h3 id='{case_id}'>{i}. {escape_html(case_display)}</h3>
+    <p class='case-name-label'><strong>Case Name:</strong> <code>{escape_html(case_name)}</code></p>
+""")
 
             # Display args if present
             case_args = case.get("args", {})
             if case_args:
-                html_parts.append("    <div class='case-args'>")
-                html_parts.append("      <strong>Default Args:</strong>")
-                html_parts.append("      <ul>")
-                for arg_key, arg_value in case_args.items():
-                    html_parts.append(f"        <li><code>@{{{arg_key}}}</code> = <code>{escape_html(str(arg_value))}</code></li>")
-                html_parts.append("      </ul>")
-                html_parts.append("    </div>")
-
-            html_parts.extend(format_description_html_fn(case_desc))
+                arg_items = "".join([
+                    f"        <li><code>@{{{arg_key}}}</code> = <code>{escape_html(str(arg_value))}</code></li>\n"
+                    for arg_key, arg_value in case_args.items()
+                ])
+                w(f"""    <div class='case-args'>
+      <strong>Default Args:</strong>
+      <ul>
+{arg_items}      </ul>
+    </div>
+""")
+
+            description_lines = format_description_html_fn(case_desc)
+            if description_lines:
+                w("\n".join(description_lines))
+                w("\n")
 
             steps = case.get("steps", [])
             if steps:
-                html_parts.append("    <table>")
-                html_parts.append("      <tr><th>#</th><th>Type</th><th>Action/Assert</th><th>Target</th><th>Details</th></tr>")
-
-                for j, step in enumerate(steps, 1):
-                    step_type = "action" if "action" in step else "assert"
-                    type_label = "Action" if step_type == "action" else "Assert"
-                    action_name = step.get("action") or step.get("assert", "?")
-                    target = step.get("id") or ", ".join(step.get("ids", [])) or "-"
-                    details = format_step_details_fn(step)
-                    html_parts.append(f"      <tr><td>{j}</td><td><span class='{step_type}'>{type_label}</span></td><td><code>{action_name}</code></td><td><code>{target}</code></td><td>{details}</td></tr>")
-
-                html_parts.append("    </table>")
-
-    html_parts.append("  </main>")
-    html_parts.append("</body>")
-    html_parts.append("</html>")
-
-    return "\n".join(html_parts)
-
-
-def _get_html_header(title: str) -> list[str]:
+                w(_STEP_TABLE_HEAD)
+                w("".join([
+                    _render_step_row(j, step, format_step_details_fn)
+                    for j, step in enumerate(steps, 1)
+                ]))
+                w("    </table>\n")
+
+    w(_HTML_FOOT)
+
+    if out is None:
+        return buf.getvalue()
+    return None
+
+
+def _render_step_row(num: int, step: dict, format_step_details_fn) -> str:
+    """Render one row of a case's step table."""
+    if "action" in step:
+        step_type, type_label = "action", "Action"
+    else:
+        step_type, type_label = "assert", "Assert"
+    return _STEP_ROW_TMPL.format(
+        num=num,
+        step_type=step_type,
+        type_label=type_label,
+        action_name=step.get("action") or step.get("assert", "?"),
+        target=step_target(step),
+        details=format_step_details_fn(step),
+    )
+
+
+def _get_html_header(title: str, stylesheet_href: str | None = None) -> str:
     """Get HTML header with styles for screen test pages."""
-    parts = [
-        "<!DOCTYPE html>",
-        "<html lang='en'>",
-        "<head>",
-        f"  <title>{escape_html(title)} - Test Documentation</title>",
-        "  <meta charset='utf-8'>",
-        "  <meta name='viewport' content='width=device-width, initial-scale=1'>",
-        "  <style>",
-    ]
-    parts.extend(get_screen_styles())
-    parts.append("  </style>")
-    parts.extend(get_toggle_script())
-    parts.extend([
-        "</head>",
-        "<body>",
-    ])
-    return parts
+    if stylesheet_href is None:
+        style = _HTML_HEAD_STYLE
+    else:
+        style = _STYLESHEET_LINK_TMPL.format(href=stylesheet_href)
+    return f"{_HTML_HEAD_OPEN}{escape_html(title)}{_HTML_HEAD_META}{style}{_HTML_HEAD_CLOSE}"
@@ -2,18 +2,132 @@
 
 from __future__ import annotations
 
+import time
+from functools import lru_cache
 
+
+@lru_cache(maxsize=8192)
 def escape_html(text: str) -> str:
     """Escape HTML special characters."""
+    # Most ids, names and paths contain nothing to escape
+    if "&" not in text and "<" not in text and ">" not in text and '"' not in text:
+        return text
     return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;")
 
 
+def generated_timestamp() -> str:
+    """Get the current "Generated:" timestamp."""
+    return time.strftime('%Y-%m-%d %H:%M:%S')
+
+
+def step_target(step: dict) -> str:
+    """Get the target element id(s) of an action/assert step, or "-" if none."""
+    target = step.get("id")
+    if target:
+        return target
+    ids = step.get("ids")
+    return ", ".join(ids) if ids else "-"
+
+
+# Sidebar icon class per flow step type; anything else is an assertion
+_STEP_ICON_CLASS = {"file": "file", "block": "block", "action": "action"}
+
+_NAV_ITEM_TMPL = "          <li><a href='../{path}' class='nav-link' title='{name}'>{name}</a></li>\n"
+
+_NAV_SECTION_TMPL = """\
+    <div class='sidebar-section'>
+      <div class='sidebar-title{title_class} collapsed' id='{section_id}-title' onclick="toggleSection('{section_id}')"><span class='arrow'>▼</span> {label} <span class='count'>{count}</span></div>
+      <div class='sidebar-list collapsed' id='{section_id}-list'>
+        <ul>
+{items}        </ul>
+      </div>
+    </div>"""
+
+# (nav key, section id, label, whether to mark the current page) of the
+# cross-page navigation sections, in sidebar order
+_NAV_SECTIONS = (
+    ('flows', 'flows', 'Flow Tests', True),
+    ('screens', 'screens', 'Screen Tests', True),
+    ('documents', 'documents', 'Documents', False),
+    ('api_docs', 'api-docs', 'API Docs', False),
+)
+
+
+def _render_nav_items(entries: list[dict]) -> str:
+    """Render the <li> items of one navigation list."""
+    fmt = _NAV_ITEM_TMPL.format
+    return "".join([fmt(path=e['path'], name=escape_html(e['name'])) for e in entries])
+
+
+def render_nav_items(all_tests_nav: dict) -> dict[str, str]:
+    """
+    Render the <li> items of every navigation list once for a whole build.
+
+    Every test page of a build shares the same navigation lists, so the
+    driver renders them up front and passes the result to each page.
+
+    Args:
+        all_tests_nav: Navigation data {'screens': [...], 'flows': [...], ...}
+
+    Returns:
+        Dict of nav key -> HTML for the list items
+    """
+    return {
+        nav_key: _render_nav_items(all_tests_nav.get(nav_key) or [])
+        for nav_key, _, _, _ in _NAV_SECTIONS
+    }
+
+
+def _nav_sections(
+    all_tests_nav: dict | None,
+    current_test_path: str | None,
+    flows_class: str,
+    screens_class: str,
+    nav_items: dict[str, str] | None = None
+) -> list[str]:
+    """
+    Render the collapsed cross-page navigation sections of a test page sidebar.
+
+    Args:
+        all_tests_nav: Navigation data {'screens': [...], 'flows': [...], ...}
+        current_test_path: Current test's relative HTML path
+        flows_class: Extra title class for the Flow Tests section
+        screens_class: Extra title class for the Screen Tests section
+        nav_items: List items pre-rendered by render_nav_items for all_tests_nav
+
+    Returns:
+        HTML blocks for the Flow Tests, Screen Tests, Documents and API Docs sections
+    """
+    if not all_tests_nav:
+        return []
+    title_classes = {'flows': flows_class, 'screens': screens_class, 'documents': ' doc', 'api_docs': ' api'}
+    fmt = _NAV_SECTION_TMPL.format
+    parts = []
+    for nav_key, section_id, label, marks_current in _NAV_SECTIONS:
+        entries = all_tests_nav.get(nav_key)
+        if entries:
+            items = nav_items[nav_key] if nav_items is not None else _render_nav_items(entries)
+            # Each page only marks its own link as current
+            if marks_current and current_test_path:
+                link = f"<a href='../{current_test_path}' class='nav-link'"
+                items = items.replace(link, f"<a href='../{current_test_path}' class='nav-link current'")
+            parts.append(fmt(
+                section_id=section_id,
+                label=label,
+                title_class=title_classes[nav_key],
+                count=len(entries),
+                items=items,
+            ))
+    return parts
+
+
 def generate_screen_sidebar(
     title: str,
     cases: list[str],
     all_tests_nav: dict | None = None,
-    current_test_path: str | None = None
-) -> list[str]:
+    current_test_path: str | None = None,
+    nav_items: dict[str, str] | None = None
+) -> str:
     """
     Generate sidebar HTML for screen test pages.
 
@@ -22,86 +136,34 @@ def generate_screen_sidebar(
         cases: List of case display names
         all_tests_nav: Navigation data {'screens': [...], 'flows': [...]}
         current_test_path: Current test's relative HTML path
+        nav_items: List items pre-rendered by render_nav_items for all_tests_nav
 
     Returns:
-        List of HTML strings for the sidebar
+        Sidebar HTML
     """
-    parts = []
-    parts.append("  <nav class='sidebar'>")
-    parts.append("    <a href='../index.html' class='back-link'>&larr; Back to Index</a>")
-    parts.append(f"    <h2>{escape_html(title)}</h2>")
+    parts = [f"""  <nav class='sidebar'>
+    <a href='../index.html' class='back-link'>&larr; Back to Index</a>
+    <h2>{escape_html(title)}</h2>"""]
 
     # Test Cases section (collapsible, expanded by default)
     if cases:
-        parts.append("    <div class='sidebar-section'>")
-        parts.append(f"      <div class='sidebar-title' id='cases-title' onclick=\"toggleSection('cases')\"><span class='arrow'>▼</span> Test Cases <span class='count'>{len(cases)}</span></div>")
-        parts.append("      <div class='sidebar-list' id='cases-list'>")
-        parts.append("        <ul>")
-        for i, case_display in enumerate(cases, 1):
-            case_id = f"case-{i}"
-            parts.append(f"          <li><a href='#{case_id}'><span class='case-number'>{i}</span><span class='case-name'>{escape_html(case_display)}</span></a></li>")
-        parts.append("        </ul>")
-        parts.append("      </div>")
-        parts.append("    </div>")
-
-    # Flow Tests navigation (collapsible, collapsed by default)
-    if all_tests_nav and all_tests_nav.get('flows'):
-        flows = all_tests_nav['flows']
-        parts.append("    <div class='sidebar-section'>")
-        parts.append(f"      <div class='sidebar-title flow collapsed' id='flows-title' onclick=\"toggleSection('flows')\"><span class='arrow'>▼</span> Flow Tests <span class='count'>{len(flows)}</span></div>")
-        parts.append("      <div class='sidebar-list collapsed' id='flows-list'>")
-        parts.append("        <ul>")
-        for f in flows:
-            is_current = current_test_path and f['path'] == current_test_path
-            current_class = " current" if is_current else ""
-            parts.append(f"          <li><a href='../{f['path']}' class='nav-link{current_class}' title='{escape_html(f['name'])}'>{escape_html(f['name'])}</a></li>")
-        parts.append("        </ul>")
-        parts.append("      </div>")
-        parts.append("    </div>")
-
-    # Screen Tests navigation (collapsible, collapsed by default)
-    if all_tests_nav and all_tests_nav.get('screens'):
-        screens = all_tests_nav['screens']
-        parts.append("    <div class='sidebar-section'>")
-        parts.append(f"      <div class='sidebar-title collapsed' id='screens-title' onclick=\"toggleSection('screens')\"><span class='arrow'>▼</span> Screen Tests <span class='count'>{len(screens)}</span></div>")
-        parts.append("      <div class='sidebar-list collapsed' id='screens-list'>")
-        parts.append("        <ul>")
-        for s in screens:
-            is_current = current_test_path and s['path'] == current_test_path
-            current_class = " current" if is_current else ""
-            parts.append(f"          <li><a href='../{s['path']}' class='nav-link{current_class}' title='{escape_html(s['name'])}'>{escape_html(s['name'])}</a></li>")
-        parts.append("        </ul>")
-        parts.append("      </div>")
-        parts.append("    </div>")
-
-    # Documents navigation (collapsible, collapsed by default)
-    if all_tests_nav and all_tests_nav.get('documents'):
-        documents = all_tests_nav['documents']
-        parts.append("    <div class='sidebar-section'>")
-        parts.append(f"      <div class='sidebar-title doc collapsed' id='documents-title' onclick=\"toggleSection('documents')\"><span class='arrow'>▼</span> Documents <span class='count'>{len(documents)}</span></div>")
-        parts.append("      <div class='sidebar-list collapsed' id='documents-list'>")
-        parts.append("        <ul>")
-        for d in documents:
-            parts.append(f"          <li><a href='../{d['path']}' class='nav-link' title='{escape_html(d['name'])}'>{escape_html(d['name'])}</a></li>")
-        parts.append("        </ul>")
-        parts.append("      </div>")
-        parts.append("    </div>")
-
-    # API Docs navigation (collapsible, collapsed by default)
-    if all_tests_nav and all_tests_nav.get('api_docs'):
-        api_docs = all_tests_nav['api_docs']
-        parts.append("    <div class='sidebar-section'>")
-        parts.append(f"      <div class='sidebar-title api collapsed' id='api-docs-title' onclick=\"toggleSection('api-docs')\"><span class='arrow'>▼</span> API Docs <span class='count'>{len(api_docs)}</span></div>")
-        parts.append("      <div class='sidebar-list collapsed' id='api-docs-list'>")
-        parts.append("        <ul>")
-        for d in api_docs:
-            parts.append(f"          <li><a href='../{d['path']}' class='nav-link' title='{escape_html(d['name'])}'>{escape_html(d['name'])}</a></li>")
-        parts.append("        </ul>")
-        parts.append("      </div>")
-        parts.append("    </div>")
+        items = "".join([
+            f"          <li><a href='#case-{i}'><span class='case-number'>{i}</span><span class='case-name'>{escape_html(case_display)}</span></a></li>\n"
+            for i, case_display in enumerate(cases, 1)
+        ])
+        parts.append(f"""    <div class='sidebar-section'>
+      <div class='sidebar-title' id='cases-title' onclick="toggleSection('cases')"><span class='arrow'>▼</span> Test Cases <span class='count'>{len(cases)}</span></div>
+      <div class='sidebar-list' id='cases-list'>
+        <ul>
+{items}        </ul>
+      </div>
+    </div>""")
+
+    # Flow Tests, Screen Tests, Documents and API Docs navigation (collapsed)
+    parts.extend(_nav_sections(all_tests_nav, current_test_path, " flow", "", nav_items))
 
     parts.append("  </nav>")
-    return parts
+    return "\n".join(parts)
 
 
 def generate_flow_sidebar(
@@ -109,8 +171,9 @@ def generate_flow_sidebar(
     steps: list[dict],
     checkpoints: list[dict],
     all_tests_nav: dict | None = None,
-    current_test_path: str | None = None
-) -> list[str]:
+    current_test_path: str | None = None,
+    nav_items: dict[str, str] | None = None
+) -> str:
     """
     Generate sidebar HTML for flow test pages.
 
@@ -120,109 +183,46 @@ def generate_flow_sidebar(
         checkpoints: List of checkpoint dicts
         all_tests_nav: Navigation data {'screens': [...], 'flows': [...]}
         current_test_path: Current test's relative HTML path
+        nav_items: List items pre-rendered by render_nav_items for all_tests_nav
 
     Returns:
-        List of HTML strings for the sidebar
+        Sidebar HTML
     """
-    parts = []
-    parts.append("  <nav class='sidebar'>")
-    parts.append("    <a href='../index.html' class='back-link'>&larr; Back to Index</a>")
-    parts.append(f"    <h2>{escape_html(name)}</h2>")
+    parts = [f"""  <nav class='sidebar'>
+    <a href='../index.html' class='back-link'>&larr; Back to Index</a>
+    <h2>{escape_html(name)}</h2>"""]
 
     # Steps section (collapsible, expanded by default)
     if steps:
-        parts.append("    <div class='sidebar-section'>")
-        parts.append(f"      <div class='sidebar-title' id='steps-title' onclick=\"toggleSection('steps')\"><span class='arrow'>▼</span> Steps <span class='count'>{len(steps)}</span></div>")
-        parts.append("      <div class='sidebar-list' id='steps-list'>")
-        parts.append("        <ul>")
-        for step in steps:
-            step_num = step["num"]
-            step_type = step["type"]
-            label = step["label"]
-
-            if step_type == "file":
-                icon_class = "file"
-            elif step_type == "block":
-                icon_class = "block"
-            elif step_type == "action":
-                icon_class = "action"
-            else:
-                icon_class = "assert"
-
-            parts.append(f"          <li><a href='#step-{step_num}'><span class='step-num'>{step_num}</span><span class='step-icon {icon_class}'></span><span class='step-label'>{escape_html(label)}</span></a></li>")
-        parts.append("        </ul>")
-        parts.append("      </div>")
-        parts.append("    </div>")
+        items = "".join([
+            f"          <li><a href='#step-{step['num']}'><span class='step-num'>{step['num']}</span><span class='step-icon {_STEP_ICON_CLASS.get(step['type'], 'assert')}'></span><span class='step-label'>{escape_html(step['label'])}</span></a></li>\n"
+            for step in steps
+        ])
+        parts.append(f"""    <div class='sidebar-section'>
+      <div class='sidebar-title' id='steps-title' onclick="toggleSection('steps')"><span class='arrow'>▼</span> Steps <span class='count'>{len(steps)}</span></div>
+      <div class='sidebar-list' id='steps-list'>
+        <ul>
+{items}        </ul>
+      </div>
+    </div>""")
 
     # Checkpoints section
     if checkpoints:
-        parts.append("    <div class='sidebar-section'>")
-        parts.append(f"      <div class='sidebar-title' id='checkpoints-title' onclick=\"toggleSection('checkpoints')\"><span class='arrow'>▼</span> Checkpoints <span class='count'>{len(checkpoints)}</span></div>")
-        parts.append("      <div class='sidebar-list' id='checkpoints-list'>")
-        for cp in checkpoints:
-            cp_name = cp.get("name", "unnamed")
-            parts.append(f"        <div class='checkpoint-item'>{escape_html(cp_name)}</div>")
-        parts.append("      </div>")
-        parts.append("    </div>")
-
-    # Flow Tests navigation (collapsible, collapsed by default)
-    if all_tests_nav and all_tests_nav.get('flows'):
-        flows = all_tests_nav['flows']
-        parts.append("    <div class='sidebar-section'>")
-        parts.append(f"      <div class='sidebar-title collapsed' id='flows-title' onclick=\"toggleSection('flows')\"><span class='arrow'>▼</span> Flow Tests <span class='count'>{len(flows)}</span></div>")
-        parts.append("      <div class='sidebar-list collapsed' id='flows-list'>")
-        parts.append("        <ul>")
-        for f in flows:
-            is_current = current_test_path and f['path'] == current_test_path
-            current_class = " current" if is_current else ""
-            parts.append(f"          <li><a href='../{f['path']}' class='nav-link{current_class}' title='{escape_html(f['name'])}'>{escape_html(f['name'])}</a></li>")
-        parts.append("        </ul>")
-        parts.append("      </div>")
-        parts.append("    </div>")
-
-    # Screen Tests navigation (collapsible, collapsed by default)
-    if all_tests_nav and all_tests_nav.get('screens'):
-        screens = all_tests_nav['screens']
-        parts.append("    <div class='sidebar-section'>")
-        parts.append(f"      <div class='sidebar-title screen collapsed' id='screens-title' onclick=\"toggleSection('screens')\"><span class='arrow'>▼</span> Screen Tests <span class='count'>{len(screens)}</span></div>")
-        parts.append("      <div class='sidebar-list collapsed' id='screens-list'>")
-        parts.append("        <ul>")
-        for s in screens:
-            is_current = current_test_path and s['path'] == current_test_path
-            current_class = " current" if is_current else ""
-            parts.append(f"          <li><a href='../{s['path']}' class='nav-link{current_class}' title='{escape_html(s['name'])}'>{escape_html(s['name'])}</a></li>")
-        parts.append("        </ul>")
-        parts.append("      </div>")
-        parts.append("    </div>")
-
-    # Documents navigation (collapsible, collapsed by default)
-    if all_tests_nav and all_tests_nav.get('documents'):
-        documents = all_tests_nav['documents']
-        parts.append("    <div class='sidebar-section'>")
-        parts.append(f"      <div class='sidebar-title doc collapsed' id='documents-title' onclick=\"toggleSection('documents')\"><span class='arrow'>▼</span> Documents <span class='count'>{len(documents)}</span></div>")
-        parts.append("      <div class='sidebar-list collapsed' id='documents-list'>")
-        parts.append("        <ul>")
-        for d in documents:
-            parts.append(f"          <li><a href='../{d['path']}' class='nav-link' title='{escape_html(d['name'])}'>{escape_html(d['name'])}</a></li>")
-        parts.append("        </ul>")
-        parts.append("      </div>")
-        parts.append("    </div>")
-
-    # API Docs navigation (collapsible, collapsed by default)
-    if all_tests_nav and all_tests_nav.get('api_docs'):
-        api_docs = all_tests_nav['api_docs']
-        parts.append("    <div class='sidebar-section'>")
-        parts.append(f"      <div class='sidebar-title api collapsed' id='api-docs-title' onclick=\"toggleSection('api-docs')\"><span class='arrow'>▼</span> API Docs <span class='count'>{len(api_docs)}</span></div>")
-        parts.append("      <div class='sidebar-list collapsed' id='api-docs-list'>")
-        parts.append("        <ul>")
-        for d in api_docs:
-            parts.append(f"          <li><a href='../{d['path']}' class='nav-link' title='{escape_html(d['name'])}'>{escape_html(d['name'])}</a></li>")
-        parts.append("        </ul>")
-        parts.append("      </div>")
-        parts.append("    </div>")
+        items = "".join([
+            f"        <div class='checkpoint-item'>{escape_html(cp.get('name', 'unnamed'))}</div>\n"
+            for cp in checkpoints
+        ])
+        parts.append(f"""    <div class='sidebar-section'>
+      <div class='sidebar-title' id='checkpoints-title' onclick="toggleSection('checkpoints')"><span class='arrow'>▼</span> Checkpoints <span class='count'>{len(checkpoints)}</span></div>
+      <div class='sidebar-list' id='checkpoints-list'>
+{items}      </div>
+    </div>""")
+
+    # Flow Tests, Screen Tests, Documents and API Docs navigation (collapsed)
+    parts.extend(_nav_sections(all_tests_nav, current_test_path, "", " screen", nav_items))
 
     parts.append("  </nav>")
-    return parts
+    return "\n".join(parts)
 
 
 def generate_index_sidebar(
@@ -232,7 +232,7 @@ def generate_index_sidebar(
     has_mermaid_diagram: bool = False,
     document_files: list[dict] | None = None,
     api_doc_categories: dict[str, list[dict]] | None = None
-) -> list[str]:
+) -> str:
     """
     Generate sidebar HTML for index page.
 
@@ -245,71 +245,78 @@ def generate_index_sidebar(
         api_doc_categories: Dict of category name -> list of API doc file dicts
 
     Returns:
-        List of HTML strings for the sidebar
+        Sidebar HTML
     """
-    parts = []
-    parts.append("  <nav class='sidebar'>")
-    parts.append(f"    <h2>{escape_html(title)}</h2>")
+    parts = [f"  <nav class='sidebar'>\n    <h2>{escape_html(title)}</h2>"]
 
     # Flow Diagram link (if available)
     if has_mermaid_diagram:
-        parts.append("    <div class='sidebar-diagram-link'>")
-        parts.append("      <a href='diagram.html'>Flow Diagram</a>")
-        parts.append("    </div>")
+        parts.append("""    <div class='sidebar-diagram-link'>
+      <a href='diagram.html'>Flow Diagram</a>
+    </div>""")
 
     # Sidebar - Flow Tests first (collapsible, starts collapsed)
     if flow_files:
-        parts.append("    <div class='sidebar-section'>")
-        parts.append(f"      <div class='sidebar-title flow collapsed' id='sidebar-flows-title' onclick=\"toggleSidebar('flows')\"><span class='arrow'>▼</span>Flow Tests <span class='count'>{len(flow_files)}</span></div>")
-        parts.append("      <div class='sidebar-list collapsed' id='sidebar-flows-list'>")
-        parts.append("        <ul>")
-        for f in flow_files:
-            parts.append(f"          <li><a href='{f['path']}' title='{escape_html(f['name'])}'>{escape_html(f['name'])}</a></li>")
-        parts.append("        </ul>")
-        parts.append("      </div>")
-        parts.append("    </div>")
+        items = "".join([
+            f"          <li><a href='{f['path']}' title='{escape_html(f['name'])}'>{escape_html(f['name'])}</a></li>\n"
+            for f in flow_files
+        ])
+        parts.append(f"""    <div class='sidebar-section'>
+      <div class='sidebar-title flow collapsed' id='sidebar-flows-title' onclick="toggleSidebar('flows')"><span class='arrow'>▼</span>Flow Tests <span class='count'>{len(flow_files)}</span></div>
+      <div class='sidebar-list collapsed' id='sidebar-flows-list'>
+        <ul>
+{items}        </ul>
+      </div>
+    </div>""")
 
     # Sidebar - Screen Tests (collapsible, starts collapsed)
     if screen_files:
-        parts.append("    <div class='sidebar-section'>")
-        parts.append(f"      <div class='sidebar-title collapsed' id='sidebar-screens-title' onclick=\"toggleSidebar('screens')\"><span class='arrow'>▼</span>Screen Tests <span class='count'>{len(screen_files)}</span></div>")
-        parts.append("      <div class='sidebar-list collapsed' id='sidebar-screens-list'>")
-        parts.append("        <ul>")
-        for f in screen_files:
-            parts.append(f"          <li><a href='{f['path']}' title='{escape_html(f['name'])}'>{escape_html(f['name'])}</a></li>")
-        parts.append("        </ul>")
-        parts.append("      </div>")
-        parts.append("    </div>")
+        items = "".join([
+            f"          <li><a href='{f['path']}' title='{escape_html(f['name'])}'>{escape_html(f['name'])}</a></li>\n"
+            for f in screen_files
+        ])
+        parts.append(f"""    <div class='sidebar-section'>
+      <div class='sidebar-title collapsed' id='sidebar-screens-title' onclick="toggleSidebar('screens')"><span class='arrow'>▼</span>Screen Tests <span class='count'>{len(screen_files)}</span></div>
+      <div class='sidebar-list collapsed' id='sidebar-screens-list'>
+        <ul>
+{items}        </ul>
+      </div>
+    </div>""")
 
     # Sidebar - Documents (collapsible, starts collapsed)
     if document_files:
-        parts.append("    <div class='sidebar-section'>")
-        parts.append(f"      <div class='sidebar-title doc collapsed' id='sidebar-documents-title' onclick=\"toggleSidebar('documents')\"><span class='arrow'>▼</span>Documents <span class='count'>{len(document_files)}</span></div>")
-        parts.append("      <div class='sidebar-list collapsed' id='sidebar-documents-list'>")
-        parts.append("        <ul>")
-        for d in document_files:
-            parts.append(f"          <li><a href='{d['path']}' title='{escape_html(d['name'])}'>{escape_html(d['name'])}</a></li>")
-        parts.append("        </ul>")
-        parts.append("      </div>")
-        parts.append("    </div>")
+        items = "".join([
+            f"          <li><a href='{d['path']}' title='{escape_html(d['name'])}'>{escape_html(d['name'])}</a></li>\n"
+            for d in document_files
+        ])
+        parts.append(f"""    <div class='sidebar-section'>
+      <div class='sidebar-title doc collapsed' id='sidebar-documents-title' onclick="toggleSidebar('documents')"><span class='arrow'>▼</span>Documents <span class='count'>{len(document_files)}</span></div>
+      <div class='sidebar-list collapsed' id='sidebar-documents-list'>
+        <ul>
+{items}        </ul>
+      </div>
+    </div>""")
 
     # Sidebar - API Doc categories (one section per directory)
     if api_doc_categories:
         for category_name, category_docs in api_doc_categories.items():
             display_name = category_name.upper() if len(category_name) <= 3 else category_name.title()
             sidebar_id = f"sidebar-api-{category_name}"
-            parts.append("    <div class='sidebar-section'>")
-            parts.append(f"      <div class='sidebar-title api collapsed' id='{sidebar_id}-title' onclick=\"toggleSidebar('api-{category_name}')\"><span class='arrow'>▼</span>{display_name} <span class='count'>{len(category_docs)}</span></div>")
-            parts.append(f"      <div class='sidebar-list collapsed' id='{sidebar_id}-list'>")
             # Add ER Diagram link for DB category
+            erd_link = ""
             if category_name.lower() == 'db':
-                parts.append(f"        <div class='sidebar-erd-link'><a href='{category_name}/erd.html'>ER Diagram</a></div>")
-            parts.append("        <ul>")
-            for d in category_docs:
-                parts.append(f"          <li><a href='{d['path']}' title='{escape_html(d['name'])}'>{escape_html(d['name'])}</a></li>")
-            parts.append("        </ul>")
-            parts.append("      </div>")
-            parts.append("    </div>")
+                erd_link = f"        <div class='sidebar-erd-link'><a href='{category_name}/erd.html'>ER Diagram</a></div>\n"
+            items = "".join([
+                f"          <li><a href='{d['path']}' title='{escape_html(d['name'])}'>{escape_html(d['name'])}</a></li>\n"
+                for d in category_docs
+            ])
+            parts.append(f"""    <div class='sidebar-section'>
+      <div class='sidebar-title api collapsed' id='{sidebar_id}-title' onclick="toggleSidebar('api-{category_name}')"><span class='arrow'>▼</span>{display_name} <span class='count'>{len(category_docs)}</span></div>
+      <div class='sidebar-list collapsed' id='{sidebar_id}-list'>
+{erd_link}        <ul>
+{items}        </ul>
+      </div>
+    </div>""")
 
     parts.append("  </nav>")
-    return parts
+    return "\n".join(parts)
@@ -1,310 +1,382 @@
 """CSS styles for HTML documentation generation."""
 
+import re
+from pathlib import Path
 
-def get_common_styles() -> list[str]:
+# Stylesheets written next to the generated pages by write_style_assets
+SCREEN_STYLESHEET = "assets/screen.css"
+FLOW_STYLESHEET = "assets/flow.css"
+
+_CSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.S)
+_CSS_SPACE_RE = re.compile(r'\s+')
+_CSS_PUNCT_RE = re.compile(r'\s*([{};,])\s*')
+
+
+def minify_css(css: str) -> str:
+    """
+    Strip comments and insignificant whitespace from a stylesheet.
+
+    Meant to run once at import time on the static stylesheets, not per page.
+
+    Args:
+        css: Pretty-printed CSS source
+
+    Returns:
+        Equivalent CSS on a single line
+    """
+    css = _CSS_COMMENT_RE.sub('', css)
+    css = _CSS_SPACE_RE.sub(' ', css)
+    css = _CSS_PUNCT_RE.sub(r'\1', css)
+    return css.replace(': ', ':').replace(';}', '}').strip()
+
+
+# Stylesheets and scripts are static, so they are kept as string constants
+# and each page stylesheet is assembled and minified once at import time.
+_COMMON_STYLES = """\
+    * { box-sizing: border-box; }
+    body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; margin: 0; padding: 0; line-height: 1.6; display: flex; }"""
+
+
+def get_common_styles() -> str:
     """Get common CSS styles shared across all HTML pages."""
-    return [
-        "    * { box-sizing: border-box; }",
-        "    body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; margin: 0; padding: 0; line-height: 1.6; display: flex; }",
-    ]
+    return _COMMON_STYLES
+
 
+_SIDEBAR_BASE_STYLES = """\
+    /* Sidebar */
+    .sidebar { width: 280px; min-width: 280px; height: 100vh; position: fixed; top: 0; left: 0; background: #f8f9fa; border-right: 1px solid #e0e0e0; overflow-y: auto; padding: 20px; }
+    .sidebar h2 { font-size: 1em; color: #333; margin: 0 0 15px 0; padding-bottom: 10px; border-bottom: 1px solid #e0e0e0; }
+    .sidebar-section { margin-bottom: 15px; }
+    .sidebar-title { font-size: 0.85em; color: #666; font-weight: 600; text-transform: uppercase; letter-spacing: 0.5px; cursor: pointer; display: flex; align-items: center; justify-content: space-between; padding: 8px 10px; background: #f0f0f0; border-radius: 6px; margin-bottom: 5px; }
+    .sidebar-title:hover { background: #e5e5e5; }
+    .sidebar-title .arrow { transition: transform 0.3s; font-size: 0.7em; }
+    .sidebar-title.collapsed .arrow { transform: rotate(-90deg); }
+    .sidebar-list { overflow: hidden; }
+    .sidebar-list.collapsed { display: none; }
+    .sidebar ul { list-style: none; padding: 0; margin: 0; }
+    .sidebar li { margin: 4px 0; display: flex; align-items: center; }
+    .sidebar li .doc-link { margin-left: auto; padding: 2px 6px; font-size: 0.9em; }
+    .back-link { display: block; padding: 10px 12px; margin-bottom: 15px; color: #007AFF; font-size: 0.9em; border-bottom: 1px solid #e0e0e0; }
+    .back-link:hover { background: #e9ecef; }
+    .nav-link { display: block; padding: 6px 12px; color: #555; text-decoration: none; border-radius: 4px; font-size: 0.85em; white-space: nowrap; overflow: hidden; text-overflow: ellipsis; }
+    .nav-link:hover { background: #e9ecef; color: #007AFF; }"""
 
-def get_sidebar_base_styles() -> list[str]:
+
+def get_sidebar_base_styles() -> str:
     """Get base sidebar styles shared across page types."""
-    return [
-        "    /* Sidebar */",
-        "    .sidebar { width: 280px; min-width: 280px; height: 100vh; position: fixed; top: 0; left: 0; background: #f8f9fa; border-right: 1px solid #e0e0e0; overflow-y: auto; padding: 20px; }",
-        "    .sidebar h2 { font-size: 1em; color: #333; margin: 0 0 15px 0; padding-bottom: 10px; border-bottom: 1px solid #e0e0e0; }",
-        "    .sidebar-section { margin-bottom: 15px; }",
-        "    .sidebar-title { font-size: 0.85em; color: #666; font-weight: 600; text-transform: uppercase; letter-spacing: 0.5px; cursor: pointer; display: flex; align-items: center; justify-content: space-between; padding: 8px 10px; background: #f0f0f0; border-radius: 6px; margin-bottom: 5px; }",
-        "    .sidebar-title:hover { background: #e5e5e5; }",
-        "    .sidebar-title .arrow { transition: transform 0.3s; font-size: 0.7em; }",
-        "    .sidebar-title.collapsed .arrow { transform: rotate(-90deg); }",
-        "    .sidebar-list { overflow: hidden; }",
-        "    .sidebar-list.collapsed { display: none; }",
-        "    .sidebar ul { list-style: none; padding: 0; margin: 0; }",
-        "    .sidebar li { margin: 4px 0; display: flex; align-items: center; }",
-        "    .sidebar li .doc-link { margin-left: auto; padding: 2px 6px; font-size: 0.9em; }",
-        "    .back-link { display: block; padding: 10px 12px; margin-bottom: 15px; color: #007AFF; font-size: 0.9em; border-bottom: 1px solid #e0e0e0; }",
-        "    .back-link:hover { background: #e9ecef; }",
-        "    .nav-link { display: block; padding: 6px 12px; color: #555; text-decoration: none; border-radius: 4px; font-size: 0.85em; white-space: nowrap; overflow: hidden; text-overflow: ellipsis; }",
-        "    .nav-link:hover { background: #e9ecef; color: #007AFF; }",
-    ]
-
-
-def get_responsive_styles() -> list[str]:
+    return _SIDEBAR_BASE_STYLES
+
+
+_RESPONSIVE_STYLES = """\
+    /* Responsive */
+    @media (max-width: 768px) {
+      .sidebar { display: none; }
+      .main-content { margin-left: 0; padding: 20px; }
+    }"""
+
+
+def get_responsive_styles() -> str:
     """Get responsive CSS styles."""
-    return [
-        "    /* Responsive */",
-        "    @media (max-width: 768px) {",
-        "      .sidebar { display: none; }",
-        "      .main-content { margin-left: 0; padding: 20px; }",
-        "    }",
-    ]
+    return _RESPONSIVE_STYLES
+
 
+_TOGGLE_SCRIPT = """\
+  <script>
+    function toggleSection(id) {
+      const title = document.getElementById(id + '-title');
+      const list = document.getElementById(id + '-list');
+      title.classList.toggle('collapsed');
+      list.classList.toggle('collapsed');
+    }
+  </script>"""
 
-def get_toggle_script() -> list[str]:
+
+def get_toggle_script() -> str:
     """Get the toggle section JavaScript."""
-    return [
-        "  <script>",
-        "    function toggleSection(id) {",
-        "      const title = document.getElementById(id + '-title');",
-        "      const list = document.getElementById(id + '-list');",
-        "      title.classList.toggle('collapsed');",
-        "      list.classList.toggle('collapsed');",
-        "    }",
-        "  </script>",
-    ]
-
-
-def get_screen_styles() -> list[str]:
+    return _TOGGLE_SCRIPT
+
+
+# Leading and trailing blocks shared by the screen and flow stylesheets,
+# minified once for both
+_SIDEBAR_PAGE_PREFIX = minify_css(_COMMON_STYLES + "\n" + _SIDEBAR_BASE_STYLES)
+_SIDEBAR_PAGE_SUFFIX = minify_css(_RESPONSIVE_STYLES)
+
+_SCREEN_EXTRA_STYLES = """\
+    .sidebar-title .count { background: #007AFF; color: white; padding: 2px 8px; border-radius: 10px; font-size: 0.75em; margin-left: 5px; }
+    .sidebar-title.flow .count { background: #7b1fa2; }
+    .sidebar-title.doc .count { background: #2e7d32; }
+    .sidebar-title.api .count { background: #f57c00; }
+    .sidebar a { display: flex; align-items: flex-start; padding: 8px 12px; color: #555; text-decoration: none; border-radius: 6px; font-size: 0.9em; transition: all 0.2s; }
+    .sidebar a:hover { background: #e9ecef; color: #007AFF; }
+    .sidebar a.active { background: #007AFF; color: white; }
+    .case-number { flex-shrink: 0; width: 24px; height: 24px; line-height: 24px; text-align: center; background: #e0e0e0; border-radius: 50%; font-size: 0.75em; font-weight: 600; margin-right: 8px; }
+    .case-name { flex: 1; word-break: break-word; }
+    .sidebar a:hover .case-number { background: #d0d0d0; }
+    .sidebar a.active .case-number { background: rgba(255,255,255,0.3); }
+    .nav-link.current { background: #007AFF; color: white; }
+    /* Main content */
+    .main-content { margin-left: 280px; padding: 30px 40px; max-width: 900px; flex: 1; }
+    h1 { color: #333; border-bottom: 2px solid #007AFF; padding-bottom: 10px; margin-top: 0; }
+    h2 { color: #555; margin-top: 30px; }
+    h3 { color: #666; margin-top: 25px; scroll-margin-top: 20px; }
+    table { border-collapse: collapse; width: 100%; margin: 15px 0; }
+    th, td { border: 1px solid #ddd; padding: 10px; text-align: left; }
+    th { background: #f5f5f5; }
+    code { background: #f0f0f0; padding: 2px 6px; border-radius: 3px; font-size: 0.9em; }
+    .info { background: #f9f9f9; padding: 15px; border-radius: 5px; margin: 15px 0; }
+    .description { color: #666; font-style: italic; margin-bottom: 20px; }
+    .action { color: #007AFF; font-weight: 500; }
+    .assert { color: #34C759; font-weight: 500; }
+    .summary { color: #333; margin-bottom: 10px; }
+    .case-name-label { color: #888; font-size: 0.9em; margin: -10px 0 15px 0; }
+    .case-name-label code { background: #f5f5f5; color: #666; }
+    .test-name-label { color: #888; font-size: 0.9em; margin: -5px 0 15px 0; }
+    .test-name-label code { background: #f5f5f5; color: #666; }
+    .desc-section { margin: 10px 0; padding-left: 10px; border-left: 3px solid #e0e0e0; }
+    .desc-section ul, .desc-section ol { margin: 5px 0; padding-left: 25px; }
+    .notes { color: #666; font-style: italic; background: #fffbf0; padding: 10px; border-radius: 5px; }
+    a { color: #007AFF; text-decoration: none; }
+    a:hover { text-decoration: underline; }
+    /* Args display */
+    .case-args, .step-args { background: #f0f7ff; padding: 10px 15px; border-radius: 5px; margin: 10px 0; border-left: 3px solid #007AFF; }
+    .case-args ul, .step-args ul { margin: 5px 0 0 0; padding-left: 20px; }
+    .case-args li, .step-args li { margin: 3px 0; }"""
+
+_SCREEN_STYLES = _SIDEBAR_PAGE_PREFIX + minify_css(_SCREEN_EXTRA_STYLES) + _SIDEBAR_PAGE_SUFFIX
+
+
+def get_screen_styles() -> str:
     """Get CSS styles for screen test HTML pages."""
-    styles = get_common_styles()
-    styles.extend(get_sidebar_base_styles())
-    styles.extend([
-        "    .sidebar-title .count { background: #007AFF; color: white; padding: 2px 8px; border-radius: 10px; font-size: 0.75em; margin-left: 5px; }",
-        "    .sidebar-title.flow .count { background: #7b1fa2; }",
-        "    .sidebar-title.doc .count { background: #2e7d32; }",
-        "    .sidebar-title.api .count { background: #f57c00; }",
-        "    .sidebar a { display: flex; align-items: flex-start; padding: 8px 12px; color: #555; text-decoration: none; border-radius: 6px; font-size: 0.9em; transition: all 0.2s; }",
-        "    .sidebar a:hover { background: #e9ecef; color: #007AFF; }",
-        "    .sidebar a.active { background: #007AFF; color: white; }",
-        "    .case-number { flex-shrink: 0; width: 24px; height: 24px; line-height: 24px; text-align: center; background: #e0e0e0; border-radius: 50%; font-size: 0.75em; font-weight: 600; margin-right: 8px; }",
-        "    .case-name { flex: 1; word-break: break-word; }",
-        "    .sidebar a:hover .case-number { background: #d0d0d0; }",
-        "    .sidebar a.active .case-number { background: rgba(255,255,255,0.3); }",
-        "    .nav-link.current { background: #007AFF; color: white; }",
-        "    /* Main content */",
-        "    .main-content { margin-left: 280px; padding: 30px 40px; max-width: 900px; flex: 1; }",
-        "    h1 { color: #333; border-bottom: 2px solid #007AFF; padding-bottom: 10px; margin-top: 0; }",
-        "    h2 { color: #555; margin-top: 30px; }",
-        "    h3 { color: #666; margin-top: 25px; scroll-margin-top: 20px; }",
-        "    table { border-collapse: collapse; width: 100%; margin: 15px 0; }",
-        "    th, td { border: 1px solid #ddd; padding: 10px; text-align: left; }",
-        "    th { background: #f5f5f5; }",
-        "    code { background: #f0f0f0; padding: 2px 6px; border-radius: 3px; font-size: 0.9em; }",
-        "    .info { background: #f9f9f9; padding: 15px; border-radius: 5px; margin: 15px 0; }",
-        "    .description { color: #666; font-style: italic; margin-bottom: 20px; }",
-        "    .action { color: #007AFF; font-weight: 500; }",
-        "    .assert { color: #34C759; font-weight: 500; }",
-        "    .summary { color: #333; margin-bottom: 10px; }",
-        "    .case-name-label { color: #888; font-size: 0.9em; margin: -10px 0 15px 0; }",
-        "    .case-name-label code { background: #f5f5f5; color: #666; }",
-        "    .test-name-label { color: #888; font-size: 0.9em; margin: -5px 0 15px 0; }",
-        "    .test-name-label code { background: #f5f5f5; color: #666; }",
-        "    .desc-section { margin: 10px 0; padding-left: 10px; border-left: 3px solid #e0e0e0; }",
-        "    .desc-section ul, .desc-section ol { margin: 5px 0; padding-left: 25px; }",
-        "    .notes { color: #666; font-style: italic; background: #fffbf0; padding: 10px; border-radius: 5px; }",
-        "    a { color: #007AFF; text-decoration: none; }",
-        "    a:hover { text-decoration: underline; }",
-        "    /* Args display */",
-        "    .case-args, .step-args { background: #f0f7ff; padding: 10px 15px; border-radius: 5px; margin: 10px 0; border-left: 3px solid #007AFF; }",
-        "    .case-args ul, .step-args ul { margin: 5px 0 0 0; padding-left: 20px; }",
-        "    .case-args li, .step-args li { margin: 3px 0; }",
-    ])
-    styles.extend(get_responsive_styles())
-    return styles
-
-
-def get_flow_styles() -> list[str]:
+    return _SCREEN_STYLES
+
+
+_FLOW_EXTRA_STYLES = """\
+    .sidebar-title .count { background: #7b1fa2; color: white; padding: 2px 8px; border-radius: 10px; font-size: 0.75em; margin-left: 5px; }
+    .sidebar-title.screen .count { background: #007AFF; }
+    .sidebar-title.doc .count { background: #2e7d32; }
+    .sidebar-title.api .count { background: #f57c00; }
+    .sidebar a { display: flex; align-items: center; padding: 8px 12px; color: #555; text-decoration: none; border-radius: 6px; font-size: 0.85em; transition: all 0.2s; }
+    .sidebar a:hover { background: #e9ecef; color: #007AFF; }
+    .step-num { flex-shrink: 0; width: 22px; height: 22px; line-height: 22px; text-align: center; background: #e0e0e0; border-radius: 50%; font-size: 0.7em; font-weight: 600; margin-right: 8px; }
+    .step-icon { margin-right: 6px; font-size: 0.9em; width: 16px; height: 16px; display: inline-block; border-radius: 3px; }
+    .step-icon.file { background: #e3f2fd; }
+    .step-icon.block { background: #fff3e0; }
+    .step-icon.action { background: #e3f2fd; }
+    .step-icon.assert { background: #e8f5e9; }
+    .step-label { flex: 1; white-space: nowrap; overflow: hidden; text-overflow: ellipsis; }
+    .checkpoint-item { padding: 6px 12px; color: #666; font-size: 0.85em; display: flex; align-items: center; }
+    .checkpoint-item::before { content: '🏁'; margin-right: 8px; }
+    .sidebar a.active { background: #7b1fa2; color: white; }
+    .nav-link.current { background: #7b1fa2; color: white; }
+    /* Main content */
+    .main-content { margin-left: 280px; padding: 30px 40px; max-width: 900px; flex: 1; }
+    h1 { color: #333; border-bottom: 2px solid #7b1fa2; padding-bottom: 10px; margin-top: 0; }
+    h2 { color: #555; margin-top: 30px; }
+    .info { background: #f9f9f9; padding: 15px; border-radius: 5px; margin: 15px 0; }
+    .test-name-label { color: #888; font-size: 0.9em; margin: -5px 0 15px 0; }
+    .test-name-label code { background: #f5f5f5; color: #666; }
+    code { background: #f0f0f0; padding: 2px 6px; border-radius: 3px; font-size: 0.9em; }
+    /* Flow steps */
+    .flow-step { background: #fff; border-radius: 8px; margin: 12px 0; box-shadow: 0 2px 4px rgba(0,0,0,0.1); overflow: hidden; }
+    .flow-step.file-ref { }
+    .flow-step.inline-action { }
+    .flow-step.inline-assert { }
+    .step-header { display: flex; align-items: center; padding: 12px 15px; background: #f8f9fa; border-bottom: 1px solid #eee; }
+    .step-number { width: 28px; height: 28px; line-height: 28px; text-align: center; background: #7b1fa2; color: white; border-radius: 50%; font-size: 0.85em; font-weight: 600; margin-right: 12px; }
+    .step-type-badge { padding: 4px 10px; border-radius: 12px; font-size: 0.8em; font-weight: 500; }
+    .step-type-badge.file { background: #e3f2fd; color: #1976d2; }
+    .step-type-badge.block { background: #fff3e0; color: #e65100; }
+    .step-type-badge.action { background: #e3f2fd; color: #007AFF; }
+    .step-type-badge.assert { background: #e8f5e9; color: #34C759; }
+    .step-content { padding: 15px; }
+    .step-detail { margin: 6px 0; }
+    .step-detail strong { color: #555; }
+    .inline-action .step-header, .inline-assert .step-header { display: flex; align-items: center; gap: 8px; flex-wrap: wrap; }
+    .inline-step-action { font-size: 0.95em; padding: 2px 6px; background: #f5f5f5; border-radius: 4px; }
+    .inline-step-target { color: #666; font-size: 0.9em; }
+    .inline-step-target code { background: #f0f0f0; padding: 2px 4px; border-radius: 3px; }
+    .inline-step-details { color: #888; font-size: 0.85em; }
+    /* Block steps */
+    .flow-step.block-step { }
+    .block-title { font-weight: 500; margin-left: 10px; color: #333; }
+    .block-steps { margin-top: 12px; padding: 12px; background: #fafafa; border-radius: 6px; border: 1px solid #eee; }
+    .block-steps-header { font-size: 0.85em; font-weight: 600; color: #666; margin-bottom: 10px; padding-bottom: 8px; border-bottom: 1px solid #e0e0e0; }
+    .block-steps table { width: 100%; border-collapse: collapse; font-size: 0.85em; margin-top: 8px; }
+    .block-steps th, .block-steps td { border: 1px solid #ddd; padding: 6px 8px; text-align: left; }
+    .block-steps th { background: #f0f0f0; font-weight: 500; }
+    .block-steps .action { color: #007AFF; font-weight: 500; }
+    .block-steps .assert { color: #34C759; font-weight: 500; }
+    /* Setup/Teardown */
+    .setup-teardown { background: #fffbf0; border-radius: 8px; padding: 10px; margin: 10px 0; }
+    .setup-teardown .flow-step { margin: 8px 0; box-shadow: none; border: 1px solid #eee; }
+    /* Checkpoints */
+    .checkpoint-list { list-style: none; padding: 0; }
+    .checkpoint-list li { padding: 10px 15px; background: #f3e5f5; border-radius: 6px; margin: 8px 0; }
+    /* Referenced cases */
+    .referenced-cases { margin-top: 15px; padding-top: 15px; border-top: 1px solid #eee; }
+    .ref-cases-header { font-weight: 600; color: #1976d2; margin-bottom: 10px; font-size: 0.9em; }
+    .ref-case { padding: 12px 0; margin: 8px 0; }
+    .ref-case-title { font-weight: 500; color: #333; margin-bottom: 4px; }
+    .ref-case-name { color: #666; font-size: 0.85em; margin-bottom: 10px; }
+    .ref-case-name code { background: #e8e8e8; }
+    .ref-steps-table { width: 100%; border-collapse: collapse; font-size: 0.85em; margin-top: 8px; }
+    .ref-steps-table th, .ref-steps-table td { border: 1px solid #ddd; padding: 6px 8px; text-align: left; }
+    .ref-steps-table th { background: #f0f0f0; font-weight: 500; }
+    .ref-steps-table .action { color: #007AFF; font-weight: 500; }
+    .ref-steps-table .assert { color: #34C759; font-weight: 500; }
+    .step-detail.warning { color: #ff9800; font-style: italic; }
+    .ref-desc-section { margin: 10px 0; padding-left: 10px; border-left: 3px solid #e0e0e0; }
+    .ref-desc-section ul, .ref-desc-section ol { margin: 5px 0; padding-left: 25px; }
+    .ref-desc-section li { margin: 2px 0; }
+    .ref-notes { color: #666; font-style: italic; background: #fffbf0; padding: 10px; border-radius: 5px; margin: 10px 0; }
+    /* Args display */
+    .step-args { background: #f0f7ff; padding: 10px 15px; border-radius: 5px; margin: 10px 0; border-left: 3px solid #007AFF; }
+    .step-args ul { margin: 5px 0 0 0; padding-left: 20px; }
+    .step-args li { margin: 3px 0; }"""
+
+_FLOW_STYLES = _SIDEBAR_PAGE_PREFIX + minify_css(_FLOW_EXTRA_STYLES) + _SIDEBAR_PAGE_SUFFIX
+
+
+def get_flow_styles() -> str:
     """Get CSS styles for flow test HTML pages."""
-    styles = get_common_styles()
-    styles.extend(get_sidebar_base_styles())
-    styles.extend([
-        "    .sidebar-title .count { background: #7b1fa2; color: white; padding: 2px 8px; border-radius: 10px; font-size: 0.75em; margin-left: 5px; }",
-        "    .sidebar-title.screen .count { background: #007AFF; }",
-        "    .sidebar-title.doc .count { background: #2e7d32; }",
-        "    .sidebar-title.api .count { background: #f57c00; }",
-        "    .sidebar a { display: flex; align-items: center; padding: 8px 12px; color: #555; text-decoration: none; border-radius: 6px; font-size: 0.85em; transition: all 0.2s; }",
-        "    .sidebar a:hover { background: #e9ecef; color: #007AFF; }",
-        "    .step-num { flex-shrink: 0; width: 22px; height: 22px; line-height: 22px; text-align: center; background: #e0e0e0; border-radius: 50%; font-size: 0.7em; font-weight: 600; margin-right: 8px; }",
-        "    .step-icon { margin-right: 6px; font-size: 0.9em; width: 16px; height: 16px; display: inline-block; border-radius: 3px; }",
-        "    .step-icon.file { background: #e3f2fd; }",
-        "    .step-icon.block { background: #fff3e0; }",
-        "    .step-icon.action { background: #e3f2fd; }",
-        "    .step-icon.assert { background: #e8f5e9; }",
-        "    .step-label { flex: 1; white-space: nowrap; overflow: hidden; text-overflow: ellipsis; }",
-        "    .checkpoint-item { padding: 6px 12px; color: #666; font-size: 0.85em; display: flex; align-items: center; }",
-        "    .checkpoint-item::before { content: '🏁'; margin-right: 8px; }",
-        "    .sidebar a.active { background: #7b1fa2; color: white; }",
-        "    .nav-link.current { background: #7b1fa2; color: white; }",
-        "    /* Main content */",
-        "    .main-content { margin-left: 280px; padding: 30px 40px; max-width: 900px; flex: 1; }",
-        "    h1 { color: #333; border-bottom: 2px solid #7b1fa2; padding-bottom: 10px; margin-top: 0; }",
-        "    h2 { color: #555; margin-top: 30px; }",
-        "    .info { background: #f9f9f9; padding: 15px; border-radius: 5px; margin: 15px 0; }",
-        "    .test-name-label { color: #888; font-size: 0.9em; margin: -5px 0 15px 0; }",
-        "    .test-name-label code { background: #f5f5f5; color: #666; }",
-        "    code { background: #f0f0f0; padding: 2px 6px; border-radius: 3px; font-size: 0.9em; }",
-        "    /* Flow steps */",
-        "    .flow-step { background: #fff; border-radius: 8px; margin: 12px 0; box-shadow: 0 2px 4px rgba(0,0,0,0.1); overflow: hidden; }",
-        "    .flow-step.file-ref { }",
-        "    .flow-step.inline-action { }",
-        "    .flow-step.inline-assert { }",
-        "    .step-header { display: flex; align-items: center; padding: 12px 15px; background: #f8f9fa; border-bottom: 1px solid #eee; }",
-        "    .step-number { width: 28px; height: 28px; line-height: 28px; text-align: center; background: #7b1fa2; color: white; border-radius: 50%; font-size: 0.85em; font-weight: 600; margin-right: 12px; }",
-        "    .step-type-badge { padding: 4px 10px; border-radius: 12px; font-size: 0.8em; font-weight: 500; }",
-        "    .step-type-badge.file { background: #e3f2fd; color: #1976d2; }",
-        "    .step-type-badge.block { background: #fff3e0; color: #e65100; }",
-        "    .step-type-badge.action { background: #e3f2fd; color: #007AFF; }",
-        "    .step-type-badge.assert { background: #e8f5e9; color: #34C759; }",
-        "    .step-content { padding: 15px; }",
-        "    .step-detail { margin: 6px 0; }",
-        "    .step-detail strong { color: #555; }",
-        "    .inline-action .step-header, .inline-assert .step-header { display: flex; align-items: center; gap: 8px; flex-wrap: wrap; }",
-        "    .inline-step-action { font-size: 0.95em; padding: 2px 6px; background: #f5f5f5; border-radius: 4px; }",
-        "    .inline-step-target { color: #666; font-size: 0.9em; }",
-        "    .inline-step-target code { background: #f0f0f0; padding: 2px 4px; border-radius: 3px; }",
-        "    .inline-step-details { color: #888; font-size: 0.85em; }",
-        "    /* Block steps */",
-        "    .flow-step.block-step { }",
-        "    .block-title { font-weight: 500; margin-left: 10px; color: #333; }",
-        "    .block-steps { margin-top: 12px; padding: 12px; background: #fafafa; border-radius: 6px; border: 1px solid #eee; }",
-        "    .block-steps-header { font-size: 0.85em; font-weight: 600; color: #666; margin-bottom: 10px; padding-bottom: 8px; border-bottom: 1px solid #e0e0e0; }",
-        "    .block-steps table { width: 100%; border-collapse: collapse; font-size: 0.85em; margin-top: 8px; }",
-        "    .block-steps th, .block-steps td { border: 1px solid #ddd; padding: 6px 8px; text-align: left; }",
-        "    .block-steps th { background: #f0f0f0; font-weight: 500; }",
-        "    .block-steps .action { color: #007AFF; font-weight: 500; }",
-        "    .block-steps .assert { color: #34C759; font-weight: 500; }",
-        "    /* Setup/Teardown */",
-        "    .setup-teardown { background: #fffbf0; border-radius: 8px; padding: 10px; margin: 10px 0; }",
-        "    .setup-teardown .flow-step { margin: 8px 0; box-shadow: none; border: 1px solid #eee; }",
-        "    /* Checkpoints */",
-        "    .checkpoint-list { list-style: none; padding: 0; }",
-        "    .checkpoint-list li { padding: 10px 15px; background: #f3e5f5; border-radius: 6px; margin: 8px 0; }",
-        "    /* Referenced cases */",
-        "    .referenced-cases { margin-top: 15px; padding-top: 15px; border-top: 1px solid #eee; }",
-        "    .ref-cases-header { font-weight: 600; color: #1976d2; margin-bottom: 10px; font-size: 0.9em; }",
-        "    .ref-case { padding: 12px 0; margin: 8px 0; }",
-        "    .ref-case-title { font-weight: 500; color: #333; margin-bottom: 4px; }",
-        "    .ref-case-name { color: #666; font-size: 0.85em; margin-bottom: 10px; }",
-        "    .ref-case-name code { background: #e8e8e8; }",
-        "    .ref-steps-table { width: 100%; border-collapse: collapse; font-size: 0.85em; margin-top: 8px; }",
-        "    .ref-steps-table th, .ref-steps-table td { border: 1px solid #ddd; padding: 6px 8px; text-align: left; }",
-        "    .ref-steps-table th { background: #f0f0f0; font-weight: 500; }",
-        "    .ref-steps-table .action { color: #007AFF; font-weight: 500; }",
-        "    .ref-steps-table .assert { color: #34C759; font-weight: 500; }",
-        "    .step-detail.warning { color: #ff9800; font-style: italic; }",
-        "    .ref-desc-section { margin: 10px 0; padding-left: 10px; border-left: 3px solid #e0e0e0; }",
-        "    .ref-desc-section ul, .ref-desc-section ol { margin: 5px 0; padding-left: 25px; }",
-        "    .ref-desc-section li { margin: 2px 0; }",
-        "    .ref-notes { color: #666; font-style: italic; background: #fffbf0; padding: 10px; border-radius: 5px; margin: 10px 0; }",
-        "    /* Args display */",
-        "    .step-args { background: #f0f7ff; padding: 10px 15px; border-radius: 5px; margin: 10px 0; border-left: 3px solid #007AFF; }",
-        "    .step-args ul { margin: 5px 0 0 0; padding-left: 20px; }",
-        "    .step-args li { margin: 3px 0; }",
-    ])
-    styles.extend(get_responsive_styles())
-    return styles
-
-
-def get_index_styles() -> list[str]:
+    return _FLOW_STYLES
+
+
+_INDEX_PAGE_STYLES = """\
+    * { box-sizing: border-box; }
+    body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; margin: 0; padding: 0; line-height: 1.6; display: flex; background: #fafafa; }
+    /* Sidebar */
+    .sidebar { width: 260px; min-width: 260px; height: 100vh; position: fixed; top: 0; left: 0; background: #fff; border-right: 1px solid #e0e0e0; overflow-y: auto; padding: 20px; }
+    .sidebar h2 { font-size: 1.1em; color: #333; margin: 0 0 20px 0; padding-bottom: 10px; border-bottom: 2px solid #007AFF; }
+    .sidebar-section { margin-bottom: 20px; }
+    .sidebar-title { font-size: 0.85em; color: #666; font-weight: 600; margin-bottom: 8px; text-transform: uppercase; letter-spacing: 0.5px; cursor: pointer; display: flex; align-items: center; justify-content: space-between; padding: 8px 10px; background: #f5f5f5; border-radius: 6px; }
+    .sidebar-title:hover { background: #e9ecef; }
+    .sidebar-title .count { background: #007AFF; color: white; padding: 2px 8px; border-radius: 10px; font-size: 0.8em; }
+    .sidebar-title.flow .count { background: #7b1fa2; }
+    .sidebar-title.doc .count { background: #2e7d32; }
+    .sidebar-title.api .count { background: #f57c00; }
+    .sidebar-title .arrow { transition: transform 0.3s; font-size: 0.7em; margin-right: 5px; }
+    .sidebar-title.collapsed .arrow { transform: rotate(-90deg); }
+    .sidebar-list { overflow: hidden; }
+    .sidebar-list.collapsed { display: none; }
+    .sidebar ul { list-style: none; padding: 0; margin: 0; }
+    .sidebar li { margin: 2px 0; display: flex; align-items: center; }
+    .sidebar li .doc-link { margin-left: auto; padding: 2px 6px; font-size: 0.9em; }
+    .sidebar a { display: block; padding: 6px 12px; color: #555; text-decoration: none; border-radius: 4px; font-size: 0.85em; white-space: nowrap; overflow: hidden; text-overflow: ellipsis; }
+    .sidebar a:hover { background: #e9ecef; color: #007AFF; }
+    /* Main content */
+    .main-content { margin-left: 260px; padding: 30px 40px; flex: 1; max-width: 900px; }
+    h1 { color: #333; border-bottom: 2px solid #007AFF; padding-bottom: 10px; margin-top: 0; }
+    .summary { background: #fff; padding: 20px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); margin-bottom: 30px; display: flex; flex-wrap: wrap; gap: 20px; }
+    .summary-item { text-align: center; min-width: 80px; }
+    .summary-value { font-size: 2em; font-weight: bold; color: #007AFF; }
+    .summary-label { color: #666; font-size: 0.9em; }
+    /* Collapsible category */
+    .category { margin-bottom: 25px; }
+    .category-header { display: flex; align-items: center; justify-content: space-between; background: #fff; padding: 15px 20px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); cursor: pointer; user-select: none; }
+    .category-header:hover { box-shadow: 0 4px 8px rgba(0,0,0,0.15); }
+    .category-header h2 { margin: 0; color: #333; font-size: 1.2em; display: flex; align-items: center; gap: 10px; }
+    .category-header .arrow { transition: transform 0.3s; font-size: 0.8em; color: #666; }
+    .category-header.collapsed .arrow { transform: rotate(-90deg); }
+    .category-badge { padding: 4px 12px; border-radius: 15px; font-size: 0.85em; font-weight: 600; }
+    .category-badge.screen { background: #e3f2fd; color: #1976d2; }
+    .category-badge.flow { background: #f3e5f5; color: #7b1fa2; }
+    .category-badge.doc { background: #e8f5e9; color: #2e7d32; }
+    .category-badge.api { background: #fff3e0; color: #f57c00; }
+    .category-content { max-height: 2000px; overflow: hidden; transition: max-height 0.3s ease-out; }
+    .category-content.collapsed { max-height: 0; }
+    .test-list { list-style: none; padding: 0; margin: 10px 0 0 0; }
+    .test-item { background: #fff; margin: 8px 0; padding: 15px 20px; border-radius: 8px; box-shadow: 0 1px 3px rgba(0,0,0,0.08); border-left: 4px solid transparent; }
+    .test-item:hover { box-shadow: 0 2px 6px rgba(0,0,0,0.12); }
+    .test-item.screen { border-left-color: #1976d2; }
+    .test-item.flow { border-left-color: #7b1fa2; }
+    .test-item.doc { border-left-color: #2e7d32; }
+    .test-item.api { border-left-color: #f57c00; }
+    .test-name { font-size: 1.05em; font-weight: 600; color: #333; text-decoration: none; }
+    .test-name:hover { color: #007AFF; }
+    .doc-link { text-decoration: none; margin-left: 8px; font-size: 1em; opacity: 0.7; transition: opacity 0.2s; }
+    .doc-link:hover { opacity: 1; }
+    .test-meta { margin-top: 5px; color: #666; font-size: 0.85em; }
+    .test-description { color: #555; margin-top: 5px; font-size: 0.9em; }
+    .badge { display: inline-block; padding: 2px 8px; border-radius: 4px; font-size: 0.75em; margin-right: 5px; }
+    .badge-screen { background: #e3f2fd; color: #1976d2; }
+    .badge-flow { background: #f3e5f5; color: #7b1fa2; }
+    .badge-platform { background: #e8f5e9; color: #388e3c; }
+    /* Flow Diagram link */
+    .diagram-link-container { margin-bottom: 25px; }
+    .diagram-link { display: flex; align-items: center; gap: 15px; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 20px 25px; border-radius: 12px; text-decoration: none; box-shadow: 0 4px 15px rgba(102, 126, 234, 0.4); transition: transform 0.2s, box-shadow 0.2s; }
+    .diagram-link:hover { transform: translateY(-2px); box-shadow: 0 6px 20px rgba(102, 126, 234, 0.5); }
+    .diagram-icon { font-size: 2em; }
+    .diagram-text { font-size: 1.2em; font-weight: 600; }
+    .diagram-desc { font-size: 0.85em; opacity: 0.9; margin-left: auto; }
+    .sidebar-diagram-link { margin-bottom: 15px; padding-bottom: 15px; border-bottom: 1px solid #e0e0e0; }
+    .sidebar-diagram-link a { display: block; padding: 10px 15px; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; border-radius: 6px; text-align: center; font-weight: 500; text-decoration: none; }
+    .sidebar-diagram-link a:hover { opacity: 0.9; }
+    /* Sidebar ER Diagram link */
+    .sidebar-erd-link { margin: 5px 0 10px 0; }
+    .sidebar-erd-link a { display: block; padding: 8px 12px; background: linear-gradient(135deg, #34d399 0%, #059669 100%); color: white; border-radius: 6px; text-align: center; font-weight: 500; font-size: 0.85em; text-decoration: none; }
+    .sidebar-erd-link a:hover { opacity: 0.9; }
+    /* ER Diagram link */
+    .erd-link-container { margin: 10px 0 15px 0; }
+    .erd-link { display: flex; align-items: center; gap: 12px; background: linear-gradient(135deg, #34d399 0%, #059669 100%); color: white; padding: 15px 20px; border-radius: 10px; text-decoration: none; box-shadow: 0 3px 10px rgba(5, 150, 105, 0.3); transition: transform 0.2s, box-shadow 0.2s; }
+    .erd-link:hover { transform: translateY(-2px); box-shadow: 0 5px 15px rgba(5, 150, 105, 0.4); }
+    .erd-icon { font-size: 1.5em; }
+    .erd-text { font-size: 1.1em; font-weight: 600; }
+    .erd-desc { font-size: 0.8em; opacity: 0.9; margin-left: auto; }
+    .generated { color: #999; font-size: 0.85em; margin-top: 30px; text-align: center; }
+    /* Responsive */
+    @media (max-width: 768px) {
+      .sidebar { display: none; }
+      .main-content { margin-left: 0; padding: 20px; }
+    }"""
+
+_INDEX_STYLES = minify_css(_INDEX_PAGE_STYLES)
+
+
+def get_index_styles() -> str:
     """Get CSS styles for index HTML page."""
-    return [
-        "    * { box-sizing: border-box; }",
-        "    body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; margin: 0; padding: 0; line-height: 1.6; display: flex; background: #fafafa; }",
-        "    /* Sidebar */",
-        "    .sidebar { width: 260px; min-width: 260px; height: 100vh; position: fixed; top: 0; left: 0; background: #fff; border-right: 1px solid #e0e0e0; overflow-y: auto; padding: 20px; }",
-        "    .sidebar h2 { font-size: 1.1em; color: #333; margin: 0 0 20px 0; padding-bottom: 10px; border-bottom: 2px solid #007AFF; }",
-        "    .sidebar-section { margin-bottom: 20px; }",
-        "    .sidebar-title { font-size: 0.85em; color: #666; font-weight: 600; margin-bottom: 8px; text-transform: uppercase; letter-spacing: 0.5px; cursor: pointer; display: flex; align-items: center; justify-content: space-between; padding: 8px 10px; background: #f5f5f5; border-radius: 6px; }",
-        "    .sidebar-title:hover { background: #e9ecef; }",
-        "    .sidebar-title .count { background: #007AFF; color: white; padding: 2px 8px; border-radius: 10px; font-size: 0.8em; }",
-        "    .sidebar-title.flow .count { background: #7b1fa2; }",
-        "    .sidebar-title.doc .count { background: #2e7d32; }",
-        "    .sidebar-title.api .count { background: #f57c00; }",
-        "    .sidebar-title .arrow { transition: transform 0.3s; font-size: 0.7em; margin-right: 5px; }",
-        "    .sidebar-title.collapsed .arrow { transform: rotate(-90deg); }",
-        "    .sidebar-list { overflow: hidden; }",
-        "    .sidebar-list.collapsed { display: none; }",
-        "    .sidebar ul { list-style: none; padding: 0; margin: 0; }",
-        "    .sidebar li { margin: 2px 0; display: flex; align-items: center; }",
-        "    .sidebar li .doc-link { margin-left: auto; padding: 2px 6px; font-size: 0.9em; }",
-        "    .sidebar a { display: block; padding: 6px 12px; color: #555; text-decoration: none; border-radius: 4px; font-size: 0.85em; white-space: nowrap; overflow: hidden; text-overflow: ellipsis; }",
-        "    .sidebar a:hover { background: #e9ecef; color: #007AFF; }",
-        "    /* Main content */",
-        "    .main-content { margin-left: 260px; padding: 30px 40px; flex: 1; max-width: 900px; }",
-        "    h1 { color: #333; border-bottom: 2px solid #007AFF; padding-bottom: 10px; margin-top: 0; }",
-        "    .summary { background: #fff; padding: 20px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); margin-bottom: 30px; display: flex; flex-wrap: wrap; gap: 20px; }",
-        "    .summary-item { text-align: center; min-width: 80px; }",
-        "    .summary-value { font-size: 2em; font-weight: bold; color: #007AFF; }",
-        "    .summary-label { color: #666; font-size: 0.9em; }",
-        "    /* Collapsible category */",
-        "    .category { margin-bottom: 25px; }",
-        "    .category-header { display: flex; align-items: center; justify-content: space-between; background: #fff; padding: 15px 20px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); cursor: pointer; user-select: none; }",
-        "    .category-header:hover { box-shadow: 0 4px 8px rgba(0,0,0,0.15); }",
-        "    .category-header h2 { margin: 0; color: #333; font-size: 1.2em; display: flex; align-items: center; gap: 10px; }",
-        "    .category-header .arrow { transition: transform 0.3s; font-size: 0.8em; color: #666; }",
-        "    .category-header.collapsed .arrow { transform: rotate(-90deg); }",
-        "    .category-badge { padding: 4px 12px; border-radius: 15px; font-size: 0.85em; font-weight: 600; }",
-        "    .category-badge.screen { background: #e3f2fd; color: #1976d2; }",
-        "    .category-badge.flow { background: #f3e5f5; color: #7b1fa2; }",
-        "    .category-badge.doc { background: #e8f5e9; color: #2e7d32; }",
-        "    .category-badge.api { background: #fff3e0; color: #f57c00; }",
-        "    .category-content { max-height: 2000px; overflow: hidden; transition: max-height 0.3s ease-out; }",
-        "    .category-content.collapsed { max-height: 0; }",
-        "    .test-list { list-style: none; padding: 0; margin: 10px 0 0 0; }",
-        "    .test-item { background: #fff; margin: 8px 0; padding: 15px 20px; border-radius: 8px; box-shadow: 0 1px 3px rgba(0,0,0,0.08); border-left: 4px solid transparent; }",
-        "    .test-item:hover { box-shadow: 0 2px 6px rgba(0,0,0,0.12); }",
-        "    .test-item.screen { border-left-color: #1976d2; }",
-        "    .test-item.flow { border-left-color: #7b1fa2; }",
-        "    .test-item.doc { border-left-color: #2e7d32; }",
-        "    .test-item.api { border-left-color: #f57c00; }",
-        "    .test-name { font-size: 1.05em; font-weight: 600; color: #333; text-decoration: none; }",
-        "    .test-name:hover { color: #007AFF; }",
-        "    .doc-link { text-decoration: none; margin-left: 8px; font-size: 1em; opacity: 0.7; transition: opacity 0.2s; }",
-        "    .doc-link:hover { opacity: 1; }",
-        "    .test-meta { margin-top: 5px; color: #666; font-size: 0.85em; }",
-        "    .test-description { color: #555; margin-top: 5px; font-size: 0.9em; }",
-        "    .badge { display: inline-block; padding: 2px 8px; border-radius: 4px; font-size: 0.75em; margin-right: 5px; }",
-        "    .badge-screen { background: #e3f2fd; color: #1976d2; }",
-        "    .badge-flow { background: #f3e5f5; color: #7b1fa2; }",
-        "    .badge-platform { background: #e8f5e9; color: #388e3c; }",
-        "    /* Flow Diagram link */",
-        "    .diagram-link-container { margin-bottom: 25px; }",
-        "    .diagram-link { display: flex; align-items: center; gap: 15px; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 20px 25px; border-radius: 12px; text-decoration: none; box-shadow: 0 4px 15px rgba(102, 126, 234, 0.4); transition: transform 0.2s, box-shadow 0.2s; }",
-        "    .diagram-link:hover { transform: translateY(-2px); box-shadow: 0 6px 20px rgba(102, 126, 234, 0.5); }",
-        "    .diagram-icon { font-size: 2em; }",
-        "    .diagram-text { font-size: 1.2em; font-weight: 600; }",
-        "    .diagram-desc { font-size: 0.85em; opacity: 0.9; margin-left: auto; }",
-        "    .sidebar-diagram-link { margin-bottom: 15px; padding-bottom: 15px; border-bottom: 1px solid #e0e0e0; }",
-        "    .sidebar-diagram-link a { display: block; padding: 10px 15px; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; border-radius: 6px; text-align: center; font-weight: 500; text-decoration: none; }",
-        "    .sidebar-diagram-link a:hover { opacity: 0.9; }",
-        "    /* Sidebar ER Diagram link */",
-        "    .sidebar-erd-link { margin: 5px 0 10px 0; }",
-        "    .sidebar-erd-link a { display: block; padding: 8px 12px; background: linear-gradient(135deg, #34d399 0%, #059669 100%); color: white; border-radius: 6px; text-align: center; font-weight: 500; font-size: 0.85em; text-decoration: none; }",
-        "    .sidebar-erd-link a:hover { opacity: 0.9; }",
-        "    /* ER Diagram link */",
-        "    .erd-link-container { margin: 10px 0 15px 0; }",
-        "    .erd-link { display: flex; align-items: center; gap: 12px; background: linear-gradient(135deg, #34d399 0%, #059669 100%); color: white; padding: 15px 20px; border-radius: 10px; text-decoration: none; box-shadow: 0 3px 10px rgba(5, 150, 105, 0.3); transition: transform 0.2s, box-shadow 0.2s; }",
-        "    .erd-link:hover { transform: translateY(-2px); box-shadow: 0 5px 15px rgba(5, 150, 105, 0.4); }",
-        "    .erd-icon { font-size: 1.5em; }",
-        "    .erd-text { font-size: 1.1em; font-weight: 600; }",
-        "    .erd-desc { font-size: 0.8em; opacity: 0.9; margin-left: auto; }",
-        "    .generated { color: #999; font-size: 0.85em; margin-top: 30px; text-align: center; }",
-        "    /* Responsive */",
-        "    @media (max-width: 768px) {",
-        "      .sidebar { display: none; }",
-        "      .main-content { margin-left: 0; padding: 20px; }",
-        "    }",
-    ]
-
-
-def get_index_scripts() -> list[str]:
+    return _INDEX_STYLES
+
+
+_INDEX_SCRIPTS = """\
+  <script>
+    function toggleCategory(id) {
+      const header = document.getElementById(id + '-header');
+      const content = document.getElementById(id + '-content');
+      header.classList.toggle('collapsed');
+      content.classList.toggle('collapsed');
+    }
+    function toggleSidebar(id) {
+      const title = document.getElementById('sidebar-' + id + '-title');
+      const list = document.getElementById('sidebar-' + id + '-list');
+      title.classList.toggle('collapsed');
+      list.classList.toggle('collapsed');
+    }
+  </script>"""
+
+
+def get_index_scripts() -> str:
     """Get JavaScript for index page."""
-    return [
-        "  <script>",
-        "    function toggleCategory(id) {",
-        "      const header = document.getElementById(id + '-header');",
-        "      const content = document.getElementById(id + '-content');",
-        "      header.classList.toggle('collapsed');",
-        "      content.classList.toggle('collapsed');",
-        "    }",
-        "    function toggleSidebar(id) {",
-        "      const title = document.getElementById('sidebar-' + id + '-title');",
-        "      const list = document.getElementById('sidebar-' + id + '-list');",
-        "      title.classList.toggle('collapsed');",
-        "      list.classList.toggle('collapsed');",
-        "    }",
-        "  </script>",
-    ]
+    return _INDEX_SCRIPTS
+
+
+def write_style_assets(output_dir: Path) -> list[Path]:
+    """
+    Write the screen and flow page stylesheets into the output directory.
+
+    Test pages generated for a documentation directory link these instead
+    of each inlining its own copy of the styles.
+
+    Args:
+        output_dir: Root output directory of the generated documentation
+
+    Returns:
+        Paths of the written stylesheets
+    """
+    written = []
+    for rel_path, css in ((SCREEN_STYLESHEET, _SCREEN_STYLES), (FLOW_STYLESHEET, _FLOW_STYLES)):
+        dest = output_dir / rel_path
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        dest.write_text(css + "\n", encoding='utf-8')
+        written.append(dest)
+    return written
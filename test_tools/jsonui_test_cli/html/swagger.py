@@ -2,33 +2,165 @@
 
 from __future__ import annotations
 
+import base64
+import gzip
+import io
 import json
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, TextIO
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
 
 from .sidebar import escape_html
 
 
-def is_swagger_file(file_path: Path) -> bool:
+# Static page head, built once at import time; only the <title> varies
+# between API pages.
+_HTML_HEAD_OPEN = """\
+<!DOCTYPE html>
+<html lang='en'>
+<head>
+  <meta charset='UTF-8'>
+  <meta name='viewport' content='width=device-width, initial-scale=1.0'>
+  <title>"""
+
+_HTML_HEAD_CLOSE = """</title>
+  <style>
+    * { margin: 0; padding: 0; box-sizing: border-box; }
+    body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; }
+    .swagger-back-header {
+      position: fixed;
+      top: 0;
+      left: 0;
+      right: 0;
+      z-index: 1000;
+      background: #1a1a2e;
+      padding: 8px 16px;
+      border-bottom: 1px solid #333;
+    }
+    .swagger-back-header .back-link {
+      color: #4dabf7;
+      text-decoration: none;
+      font-size: 14px;
+    }
+    .swagger-back-header .back-link:hover {
+      text-decoration: underline;
+    }
+    #redoc-container {
+      padding-top: 40px;
+    }
+  </style>
+</head>
+<body>"""
+
+# Specs at least this large (serialized) are embedded gzip-compressed
+_COMPRESS_SPEC_MIN_BYTES = 64 * 1024
+
+_REDOC_OPTIONS = """{
+      scrollYOffset: 0,
+      hideDownloadButton: false,
+      expandResponses: '200,201',
+      pathInMiddlePanel: true,
+      hideHostname: true,
+      nativeScrollbars: true,
+    }"""
+
+# Static Redoc bootstrap. The serialized spec is written between the
+# open/close pair for its embedding, never formatted into a template.
+_REDOC_OPEN = """
+    <div id='redoc-container'></div>
+
+  <!-- Redoc -->
+  <script src='https://cdn.redoc.ly/redoc/latest/bundles/redoc.standalone.js'></script>
+  <script>
+"""
+
+_INLINE_SPEC_OPEN = "    const spec = "
+
+_INLINE_SPEC_CLOSE = (
+    ";\n    Redoc.init(spec, " + _REDOC_OPTIONS
+    + ", document.getElementById('redoc-container'));\n"
+)
+
+_GZIP_SPEC_OPEN = "    const specGz = '"
+
+_GZIP_SPEC_CLOSE = """';
+    new Response(
+      new Blob([Uint8Array.from(atob(specGz), c => c.charCodeAt(0))])
+        .stream().pipeThrough(new DecompressionStream('gzip'))
+    ).json().then(spec => Redoc.init(spec, """ + _REDOC_OPTIONS + """, document.getElementById('redoc-container')));
+"""
+
+_HTML_FOOT = "  </script>\n</body>\n</html>"
+
+
+def _loads_json(raw: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _load_json_file(file_path: Path) -> Any:
+    """Load a JSON file, using orjson when it is installed."""
+    return _loads_json(file_path.read_bytes())
+
+
+def _dump_json(data: Any) -> bytes:
+    """Serialize data to compact UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def load_swagger_file(file_path: Path) -> dict | None:
     """
-    Check if a file is a Swagger/OpenAPI document.
+    Load a file if it is a Swagger/OpenAPI document.
+
+    Detection and parsing share a single read, so callers that need the
+    data should use this instead of is_swagger_file + parse_swagger_file.
 
     Args:
         file_path: Path to the JSON file
 
     Returns:
-        True if the file is a Swagger/OpenAPI document
+        Parsed swagger data dict, or None if the file is not a readable
+        Swagger/OpenAPI document
     """
-    if not file_path.exists() or file_path.suffix.lower() != '.json':
-        return False
+    if file_path.suffix.lower() != '.json':
+        return None
 
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        # Check for OpenAPI 3.x or Swagger 2.0
-        return 'openapi' in data or 'swagger' in data
+        raw = file_path.read_bytes()
+        # A spec has to spell out one of the version keys, so most other
+        # JSON files are rejected here without being parsed
+        if b'"openapi"' not in raw and b'"swagger"' not in raw:
+            return None
+        data = _loads_json(raw)
     except Exception:
-        return False
+        return None
+
+    # Check for OpenAPI 3.x or Swagger 2.0
+    if isinstance(data, dict) and ('openapi' in data or 'swagger' in data):
+        return data
+    return None
+
+
+def is_swagger_file(file_path: Path) -> bool:
+    """
+    Check if a file is a Swagger/OpenAPI document.
+
+    Args:
+        file_path: Path to the JSON file
+
+    Returns:
+        True if the file is a Swagger/OpenAPI document
+    """
+    return load_swagger_file(file_path) is not None
 
 
 def parse_swagger_file(file_path: Path) -> dict | None:
@@ -42,15 +174,16 @@ def parse_swagger_file(file_path: Path) -> dict | None:
         Parsed swagger data dict or None if parsing fails
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return _load_json_file(file_path)
     except Exception:
         return None
 
 
+@lru_cache(maxsize=256)
 def _get_relative_root(doc_path: str) -> str:
     """Calculate relative path to root from document path."""
-    depth = len(Path(doc_path).parent.parts)
+    # Doc paths are plain '/'-separated relative paths like 'api/users.html'
+    depth = doc_path.count('/')
     if depth == 0:
         return "./"
     return "../" * depth
@@ -84,8 +217,9 @@ def generate_swagger_html(
     swagger_data: dict,
     title: str | None = None,
     all_tests_nav: dict | None = None,
-    current_doc_path: str | None = None
-) -> str:
+    current_doc_path: str | None = None,
+    out: TextIO | None = None
+) -> str | None:
     """
     Generate HTML documentation page from Swagger/OpenAPI data using Redoc.
 
@@ -94,84 +228,44 @@ def generate_swagger_html(
         title: Optional title override
         all_tests_nav: Navigation data for sidebar
         current_doc_path: Current document's relative path
+        out: Optional text stream to write the page to instead of returning it
 
     Returns:
-        Complete HTML string with sidebar and embedded Redoc
+        Complete HTML string with sidebar and embedded Redoc, or None if
+        written to out
     """
     # Extract info
     info = swagger_data.get('info', {})
     doc_title = title or info.get('title', 'API Documentation')
 
-    # Convert swagger data to JSON string for embedding
-    swagger_json = json.dumps(swagger_data, ensure_ascii=False)
-
     # Build HTML
-    html_parts = _get_html_header(doc_title)
-    html_parts.extend(generate_swagger_back_link(current_doc_path))
-
-    # Main content with Redoc (full width, Redoc has its own sidebar)
-    html_parts.extend([
-        "    <div id='redoc-container'></div>",
-        "",
-        "  <!-- Redoc -->",
-        "  <script src='https://cdn.redoc.ly/redoc/latest/bundles/redoc.standalone.js'></script>",
-        "  <script>",
-        f"    const spec = {swagger_json};",
-        "    Redoc.init(spec, {",
-        "      scrollYOffset: 0,",
-        "      hideDownloadButton: false,",
-        "      expandResponses: '200,201',",
-        "      pathInMiddlePanel: true,",
-        "      hideHostname: true,",
-        "      nativeScrollbars: true,",
-        "    }, document.getElementById('redoc-container'));",
-        "  </script>",
-    ])
-
-    # Close HTML
-    html_parts.extend([
-        "</body>",
-        "</html>"
-    ])
-
-    return '\n'.join(html_parts)
-
-
-def _get_html_header(title: str) -> list[str]:
+    buf = io.StringIO() if out is None else None
+    w = buf.write if out is None else out.write
+    w(_get_html_header(doc_title))
+    w('\n')
+    w('\n'.join(generate_swagger_back_link(current_doc_path)))
+
+    # Main content with Redoc (full width, Redoc has its own sidebar).
+    # The spec can be megabytes, so it is written on its own rather than
+    # being spliced into a larger string first.
+    w(_REDOC_OPEN)
+    spec_json = _dump_json(swagger_data)
+    if len(spec_json) < _COMPRESS_SPEC_MIN_BYTES:
+        w(_INLINE_SPEC_OPEN)
+        w(spec_json.decode('utf-8'))
+        w(_INLINE_SPEC_CLOSE)
+    else:
+        # Large specs are embedded gzip-compressed and inflated in the browser
+        w(_GZIP_SPEC_OPEN)
+        w(base64.b64encode(gzip.compress(spec_json, compresslevel=6, mtime=0)).decode('ascii'))
+        w(_GZIP_SPEC_CLOSE)
+    w(_HTML_FOOT)
+
+    if out is None:
+        return buf.getvalue()
+    return None
+
+
+def _get_html_header(title: str) -> str:
     """Generate HTML header with minimal styles for Swagger documentation with Redoc."""
-    parts = [
-        "<!DOCTYPE html>",
-        "<html lang='en'>",
-        "<head>",
-        "  <meta charset='UTF-8'>",
-        "  <meta name='viewport' content='width=device-width, initial-scale=1.0'>",
-        f"  <title>{escape_html(title)}</title>",
-        "  <style>",
-        "    * { margin: 0; padding: 0; box-sizing: border-box; }",
-        "    body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; }",
-        "    .swagger-back-header {",
-        "      position: fixed;",
-        "      top: 0;",
-        "      left: 0;",
-        "      right: 0;",
-        "      z-index: 1000;",
-        "      background: #1a1a2e;",
-        "      padding: 8px 16px;",
-        "      border-bottom: 1px solid #333;",
-        "    }",
-        "    .swagger-back-header .back-link {",
-        "      color: #4dabf7;",
-        "      text-decoration: none;",
-        "      font-size: 14px;",
-        "    }",
-        "    .swagger-back-header .back-link:hover {",
-        "      text-decoration: underline;",
-        "    }",
-        "    #redoc-container {",
-        "      padding-top: 40px;",
-        "    }",
-        "  </style>",
-        "</head>",
-        "<body>",
-    ]
-    return parts
+    return f"{_HTML_HEAD_OPEN}{escape_html(title)}{_HTML_HEAD_CLOSE}"
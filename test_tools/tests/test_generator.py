@@ -404,6 +404,151 @@ class TestFlowTestHtmlGeneration:
         finally:
             temp_path.unlink()
 
+    def test_sidebar_nav_marks_only_current_page(self):
+        """Test the shared nav list marks each page's own link as current."""
+        from jsonui_test_cli.html import generate_screen_sidebar, generate_flow_sidebar
+
+        nav = {
+            'flows': [{'name': 'checkout', 'path': 'flows/checkout.html'}],
+            'screens': [
+                {'name': 'login', 'path': 'screens/login.html'},
+                {'name': 'home', 'path': 'screens/home.html'},
+            ],
+        }
+
+        login = generate_screen_sidebar("Login", ["case"], nav, "screens/login.html")
+        home = generate_screen_sidebar("Home", ["case"], nav, "screens/home.html")
+        checkout = generate_flow_sidebar("checkout", [], [], nav, "flows/checkout.html")
+
+        assert login.count(" current") == 1
+        assert "href='../screens/login.html' class='nav-link current'" in login
+        assert home.count(" current") == 1
+        assert "href='../screens/home.html' class='nav-link current'" in home
+        assert checkout.count(" current") == 1
+        assert "href='../flows/checkout.html' class='nav-link current'" in checkout
+
+        # Pre-rendered items give the same sidebar as rendering per page
+        from jsonui_test_cli.html.sidebar import render_nav_items
+        nav_items = render_nav_items(nav)
+        assert generate_screen_sidebar("Login", ["case"], nav, "screens/login.html", nav_items) == login
+        assert generate_flow_sidebar("checkout", [], [], nav, "flows/checkout.html", nav_items) == checkout
+
+    def test_sidebar_nav_reflects_list_changes(self):
+        """Test a nav list changed in place is rendered with its new entries."""
+        from jsonui_test_cli.html import generate_screen_sidebar
+
+        nav = {'screens': [{'name': 'login', 'path': 'screens/login.html'}]}
+        generate_screen_sidebar("Login", ["case"], nav, "screens/login.html")
+        nav['screens'].append({'name': 'home', 'path': 'screens/home.html'})
+
+        home = generate_screen_sidebar("Home", ["case"], nav, "screens/home.html")
+        assert "href='../screens/home.html' class='nav-link current'" in home
+        assert "<span class='count'>2</span>" in home
+
+    def test_block_description_resolved_once(self, tmp_path):
+        """Test block description file is read once for sidebar and step."""
+        import json
+
+        (tmp_path / "block_desc.json").write_text(json.dumps({"summary": "Fill in the form"}))
+        test_file = tmp_path / "block.test.json"
+        test_file.write_text(json.dumps({
+            "type": "flow",
+            "metadata": {"name": "block_flow"},
+            "steps": [
+                {
+                    "block": "fill_form",
+                    "descriptionFile": "block_desc.json",
+                    "steps": [{"action": "tap", "id": "submit"}]
+                }
+            ]
+        }))
+
+        calls = []
+        resolve = self.generator._resolve_block_description
+        self.generator._resolve_block_description = lambda step: calls.append(step) or resolve(step)
+
+        content = self.generator.generate(test_file, format="html")
+
+        assert len(calls) == 1
+        # Summary is used both in the sidebar and as the block title
+        assert content.count("Fill in the form") >= 2
+        assert "<span class='block-title'>Fill in the form</span>" in content
+
+    def test_screen_case_description_resolved_once(self, tmp_path):
+        """Test screen case descriptions are resolved once for sidebar and body."""
+        import json
+
+        (tmp_path / "desc.json").write_text(json.dumps({"summary": "Shows the form"}))
+        test_file = tmp_path / "screen.test.json"
+        test_file.write_text(json.dumps({
+            "type": "screen",
+            "metadata": {"name": "desc_screen"},
+            "cases": [
+                {"name": "initial", "descriptionFile": "desc.json", "steps": [{"action": "back"}]},
+                {"name": "back_tap", "steps": [{"action": "back"}]}
+            ]
+        }))
+
+        calls = []
+        resolve = self.generator._resolve_description
+        self.generator._resolve_description = lambda case: calls.append(case) or resolve(case)
+
+        content = self.generator.generate(test_file, format="html")
+
+        assert len(calls) == 2
+        assert "<span class='case-name'>Shows the form</span>" in content
+        assert "<h3 id='case-1'>1. Shows the form</h3>" in content
+        assert "<h3 id='case-2'>2. back_tap</h3>" in content
+
+    def test_flow_html_write_to_stream(self, tmp_path):
+        """Test flow page streamed to a file object matches the returned string."""
+        import io
+        import json
+
+        test_file = tmp_path / "stream.test.json"
+        test_file.write_text(json.dumps({
+            "type": "flow",
+            "metadata": {"name": "stream_flow"},
+            "steps": [
+                {"file": "screens/login", "case": "valid_login"},
+                {"action": "tap", "id": "login_button"}
+            ],
+            "checkpoints": [{"name": "done", "afterStep": 1}]
+        }))
+
+        self.generator._test_file_path = test_file
+        result = self.generator.validator.validate_file(test_file)
+        expected = self.generator._generate_html(result)
+
+        buf = io.StringIO()
+        assert self.generator._generate_html(result, out=buf) is None
+        assert buf.getvalue() == expected
+
+    def test_screen_html_write_to_stream(self, tmp_path):
+        """Test screen page streamed to a file object matches the returned string."""
+        import io
+        import json
+
+        test_file = tmp_path / "stream.test.json"
+        test_file.write_text(json.dumps({
+            "type": "screen",
+            "source": {"layout": "layouts/login.json"},
+            "metadata": {"name": "stream_screen"},
+            "cases": [
+                {"name": "initial", "args": {"user": "a"}, "steps": [{"assert": "visible", "id": "title"}]},
+                {"name": "no_steps", "steps": []}
+            ]
+        }))
+
+        self.generator._test_file_path = test_file
+        result = self.generator.validator.validate_file(test_file)
+        expected = self.generator._generate_html(result)
+
+        buf = io.StringIO()
+        assert self.generator._generate_html(result, out=buf) is None
+        assert buf.getvalue() == expected
+        assert expected.endswith("</html>")
+
 
 class TestArgsHtmlGeneration:
     """Tests for args display in HTML generation."""
@@ -672,6 +817,17 @@ class TestHtmlDirectoryGeneration:
             assert (output_dir / "screens" / "login.test.html").exists()
             assert (output_dir / "flows" / "login_flow.test.html").exists()
 
+            # Test pages link the shared stylesheets instead of inlining them
+            from jsonui_test_cli.html import get_flow_styles, get_screen_styles
+            assert (output_dir / "assets" / "screen.css").read_text() == get_screen_styles() + "\n"
+            assert (output_dir / "assets" / "flow.css").read_text() == get_flow_styles() + "\n"
+            screen_content = (output_dir / "screens" / "login.test.html").read_text()
+            flow_content = (output_dir / "flows" / "login_flow.test.html").read_text()
+            assert "<link rel='stylesheet' href='../assets/screen.css'>" in screen_content
+            assert "<link rel='stylesheet' href='../assets/flow.css'>" in flow_content
+            assert "<style>" not in screen_content
+            assert "<style>" not in flow_content
+
             # Check index has both categories
             index_content = (output_dir / "index.html").read_text()
             assert "Screen Tests" in index_content
@@ -768,6 +924,446 @@ class TestHtmlDirectoryGeneration:
             assert "Test Cases" in index_content
             assert "Total Steps" in index_content
 
+    def test_generate_html_directory_parallel_matches_serial(self, tmp_path, monkeypatch):
+        """Test pages written by worker processes match the serial output."""
+        from jsonui_test_cli import generator
+        from jsonui_test_cli.generator import generate_html_directory
+        import json
+        import re
+
+        input_dir = tmp_path / "tests"
+        input_dir.mkdir()
+        for i in range(3):
+            with open(input_dir / f"screen_{i}.test.json", 'w') as f:
+                json.dump({
+                    "type": "screen",
+                    "metadata": {"name": f"screen_{i}"},
+                    "cases": [{"name": "case1", "steps": [{"action": "tap", "id": "btn"}]}]
+                }, f)
+        with open(input_dir / "flow.test.json", 'w') as f:
+            json.dump({
+                "type": "flow",
+                "metadata": {"name": "flow"},
+                "steps": [{"file": "screen_0", "case": "case1"}]
+            }, f)
+
+        serial = generate_html_directory(input_dir, tmp_path / "serial", "Docs")
+        parallel = generate_html_directory(input_dir, tmp_path / "parallel", "Docs", jobs=2)
+
+        assert parallel == serial
+        strip = lambda text: re.sub(r"\d{4}-\d\d-\d\d \d\d:\d\d:\d\d", "", text)
+        for info in serial:
+            assert strip((tmp_path / "parallel" / info['path']).read_text()) == \
+                strip((tmp_path / "serial" / info['path']).read_text())
+
+        # Workers stamp their pages with the time taken by the parent build
+        monkeypatch.setattr(generator, "generated_timestamp", lambda: "2001-01-01 00:00:00")
+        parallel = generate_html_directory(input_dir, tmp_path / "stamped", "Docs", jobs=2)
+        for page in [info['path'] for info in parallel] + ["index.html"]:
+            stamps = re.findall(r"\d{4}-\d\d-\d\d \d\d:\d\d:\d\d", (tmp_path / "stamped" / page).read_text())
+            assert stamps == ["2001-01-01 00:00:00"]
+
+    def test_generate_html_directory_timestamp_per_build(self, tmp_path, monkeypatch):
+        """Test each build stamps all of its pages with its own time."""
+        from jsonui_test_cli import generator
+        import json
+
+        input_dir = tmp_path / "tests"
+        input_dir.mkdir()
+        with open(input_dir / "login.test.json", 'w') as f:
+            json.dump({
+                "type": "screen",
+                "metadata": {"name": "login"},
+                "cases": [{"name": "case1", "steps": [{"action": "tap", "id": "btn"}]}]
+            }, f)
+
+        for stamp in ("2001-01-01 00:00:00", "2002-02-02 00:00:00"):
+            monkeypatch.setattr(generator, "generated_timestamp", lambda: stamp)
+            generator.generate_html_directory(input_dir, tmp_path / "html", "Docs")
+            assert f"Generated:</strong> {stamp}" in (tmp_path / "html" / "screens" / "login.test.html").read_text()
+            assert f"Generated: {stamp}" in (tmp_path / "html" / "index.html").read_text()
+
+    def test_generate_html_directory_incremental(self, tmp_path):
+        """Test incremental builds only regenerate pages whose inputs changed."""
+        from jsonui_test_cli.generator import generate_html_directory
+        import json
+        import os
+
+        input_dir = tmp_path / "tests"
+        (input_dir / "screens").mkdir(parents=True)
+        (input_dir / "flows").mkdir()
+        screen_file = input_dir / "screens" / "login.test.json"
+        screen_file.write_text(json.dumps({
+            "type": "screen",
+            "metadata": {"name": "login"},
+            "cases": [{"name": "case1", "steps": [{"action": "tap", "id": "btn"}]}]
+        }))
+        (input_dir / "flows" / "main.test.json").write_text(json.dumps({
+            "type": "flow",
+            "metadata": {"name": "main"},
+            "steps": [{"file": "login", "case": "case1"}]
+        }))
+        (input_dir / "flows" / "other.test.json").write_text(json.dumps({
+            "type": "flow",
+            "metadata": {"name": "other"},
+            "steps": [{"action": "tap", "id": "btn"}]
+        }))
+        output_dir = tmp_path / "html"
+
+        generate_html_directory(input_dir, output_dir, "Docs", incremental=True)
+        pages = [output_dir / "screens" / "login.test.html",
+                 output_dir / "flows" / "main.test.html",
+                 output_dir / "flows" / "other.test.html"]
+        # Backdate inputs so the outputs are clearly newer
+        for path in input_dir.rglob("*.json"):
+            os.utime(path, (1, 1))
+        mtimes = [p.stat().st_mtime_ns for p in pages]
+
+        files = generate_html_directory(input_dir, output_dir, "Docs", incremental=True)
+        assert len(files) == 3
+        assert [p.stat().st_mtime_ns for p in pages] == mtimes
+
+        # Changing the screen test rebuilds it and the flow that references it
+        os.utime(screen_file, None)
+        generate_html_directory(input_dir, output_dir, "Docs", incremental=True)
+        assert pages[0].stat().st_mtime_ns != mtimes[0]
+        assert pages[1].stat().st_mtime_ns != mtimes[1]
+        assert pages[2].stat().st_mtime_ns == mtimes[2]
+
+    def test_generate_html_directory_incremental_missing_description(self, tmp_path):
+        """Test a page is rebuilt once a description file it could not find is created."""
+        from jsonui_test_cli.generator import generate_html_directory
+        import json
+        import os
+
+        input_dir = tmp_path / "tests"
+        (input_dir / "screens").mkdir(parents=True)
+        screen_file = input_dir / "screens" / "login.test.json"
+        screen_file.write_text(json.dumps({
+            "type": "screen",
+            "metadata": {"name": "login"},
+            "cases": [{
+                "name": "c1",
+                "descriptionFile": "descriptions/c1.json",
+                "steps": [{"action": "tap", "id": "btn"}]
+            }]
+        }))
+        output_dir = tmp_path / "html"
+        page = output_dir / "screens" / "login.test.html"
+
+        generate_html_directory(input_dir, output_dir, "Docs", incremental=True)
+        assert "Description file not found" in page.read_text()
+        os.utime(screen_file, (1, 1))
+        mtime = page.stat().st_mtime_ns
+
+        # Still missing: the page stays up to date
+        generate_html_directory(input_dir, output_dir, "Docs", incremental=True)
+        assert page.stat().st_mtime_ns == mtime
+
+        # Created with an old mtime: existence alone triggers the rebuild
+        desc_file = input_dir / "screens" / "descriptions" / "c1.json"
+        desc_file.parent.mkdir()
+        desc_file.write_text(json.dumps({"summary": "Found it"}))
+        os.utime(desc_file, (1, 1))
+        generate_html_directory(input_dir, output_dir, "Docs", incremental=True)
+        content = page.read_text()
+        assert "Description file not found" not in content
+        assert "Found it" in content
+
+    def test_generate_html_directory_incremental_missing_ref_description(self, tmp_path):
+        """Test a flow page is rebuilt once a referenced case's description file is created."""
+        from jsonui_test_cli.generator import generate_html_directory
+        import json
+        import os
+
+        input_dir = tmp_path / "tests"
+        (input_dir / "screens").mkdir(parents=True)
+        (input_dir / "flows").mkdir()
+        screen_file = input_dir / "screens" / "login.test.json"
+        screen_file.write_text(json.dumps({
+            "type": "screen",
+            "metadata": {"name": "login"},
+            "cases": [{
+                "name": "c1",
+                "descriptionFile": "descriptions/c1.json",
+                "steps": [{"action": "tap", "id": "btn"}]
+            }]
+        }))
+        flow_file = input_dir / "flows" / "checkout.test.json"
+        flow_file.write_text(json.dumps({
+            "type": "flow",
+            "metadata": {"name": "checkout"},
+            "steps": [{"file": "login", "case": "c1"}]
+        }))
+        output_dir = tmp_path / "html"
+        page = output_dir / "flows" / "checkout.test.html"
+
+        generate_html_directory(input_dir, output_dir, "Docs", incremental=True)
+        assert "Found it" not in page.read_text()
+        os.utime(screen_file, (1, 1))
+        os.utime(flow_file, (1, 1))
+        mtime = page.stat().st_mtime_ns
+
+        generate_html_directory(input_dir, output_dir, "Docs", incremental=True)
+        assert page.stat().st_mtime_ns == mtime
+
+        desc_file = input_dir / "screens" / "descriptions" / "c1.json"
+        desc_file.parent.mkdir()
+        desc_file.write_text(json.dumps({"summary": "Found it"}))
+        os.utime(desc_file, (1, 1))
+        generate_html_directory(input_dir, output_dir, "Docs", incremental=True)
+        assert "Found it" in page.read_text()
+
+    def test_generate_html_directory_incremental_missing_ref_file(self, tmp_path):
+        """Test a flow page is rebuilt once the test file it references is created."""
+        from jsonui_test_cli.generator import generate_html_directory
+        import json
+        import os
+
+        input_dir = tmp_path / "tests"
+        (input_dir / "flows").mkdir(parents=True)
+        (input_dir / "screens").mkdir()
+        flow_file = input_dir / "flows" / "checkout.test.json"
+        flow_file.write_text(json.dumps({
+            "type": "flow",
+            "metadata": {"name": "checkout"},
+            "steps": [{"file": "signup", "case": "c1"}]
+        }))
+        output_dir = tmp_path / "html"
+        page = output_dir / "flows" / "checkout.test.html"
+
+        generate_html_directory(input_dir, output_dir, "Docs", incremental=True)
+        assert "Referenced file not found: signup" in page.read_text()
+        os.utime(flow_file, (1, 1))
+        mtime = page.stat().st_mtime_ns
+
+        generate_html_directory(input_dir, output_dir, "Docs", incremental=True)
+        assert page.stat().st_mtime_ns == mtime
+
+        # Not a *.test.json, so the navigation (and build key) stays the same
+        ref_file = input_dir / "screens" / "signup.json"
+        ref_file.write_text(json.dumps({
+            "type": "screen",
+            "cases": [{"name": "c1", "description": "Sign up", "steps": []}]
+        }))
+        os.utime(ref_file, (1, 1))
+        generate_html_directory(input_dir, output_dir, "Docs", incremental=True)
+        content = page.read_text()
+        assert "Referenced file not found" not in content
+        assert "Sign up" in content
+
+
+class TestErdHtmlGeneration:
+    """Tests for ER diagram HTML generation."""
+
+    def _schema_file(self, table_name, group=None, properties=None):
+        info = {"title": table_name.title(), "x-table-name": table_name}
+        if group:
+            info["x-erd-group"] = group
+        return {
+            "name": table_name,
+            "path": f"db/{table_name}.html",
+            "swagger_data": {
+                "openapi": "3.0.0",
+                "info": info,
+                "components": {"schemas": {
+                    table_name.title(): {
+                        "type": "object",
+                        "properties": properties or {"id": {"type": "integer", "x-primary-key": True}},
+                    }
+                }},
+            },
+        }
+
+    def test_group_diagrams_are_lazy(self):
+        """Test group diagram source is shipped as inert text, not a Mermaid block."""
+        from jsonui_test_cli.html import generate_erd_html
+
+        html = generate_erd_html([
+            self._schema_file("users", group="user"),
+            self._schema_file("posts", group="content"),
+        ])
+
+        # Only the "all" diagram is a Mermaid block on load
+        assert html.count("<pre class='mermaid'>") == 1
+        assert "<script type='text/plain' id='src-user'>" in html
+        assert "<script type='text/plain' id='src-content'>" in html
+        assert "document.getElementById('src-' + tabName)" in html
+
+    def test_group_main_table_rendered_first(self):
+        """Test the x-erd-main table comes first in its group diagram only."""
+        from jsonui_test_cli.html import generate_erd_html
+
+        posts = self._schema_file("posts", group="user")
+        users = self._schema_file("users", group="user")
+        users["swagger_data"]["info"]["x-erd-main"] = True
+        html = generate_erd_html([posts, users])
+
+        group_src = html.split("id='src-user'>", 1)[1].split("</script>", 1)[0]
+        assert group_src.index("users {") < group_src.index("posts {")
+        all_src = html.split("class='mermaid'>", 1)[1].split("</pre>", 1)[0]
+        assert all_src.index("posts {") < all_src.index("users {")
+
+    def test_write_to_stream(self):
+        """Test writing to an output stream matches the returned string."""
+        from jsonui_test_cli.html import generate_erd_html
+        import io
+
+        schema_files = [self._schema_file("users", group="user")]
+        buffer = io.StringIO()
+
+        assert generate_erd_html(schema_files, out=buffer) is None
+        assert buffer.getvalue() == generate_erd_html(schema_files)
+
+    def test_stylesheet_copied_with_erd(self):
+        """Test the ER diagram page links a stylesheet that is written to the output."""
+        from jsonui_test_cli.generator import generate_html_directory
+        import tempfile
+        import json
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_dir = Path(temp_dir) / "tests"
+            input_dir.mkdir()
+            screen_test = {
+                "type": "screen",
+                "metadata": {"name": "login_test"},
+                "cases": [{"name": "initial", "steps": [{"action": "back"}]}]
+            }
+            with open(input_dir / "login.test.json", 'w') as f:
+                json.dump(screen_test, f)
+
+            db_dir = Path(temp_dir) / "db"
+            db_dir.mkdir()
+            with open(db_dir / "users.json", 'w') as f:
+                json.dump(self._schema_file("users")["swagger_data"], f)
+
+            output_dir = Path(temp_dir) / "html"
+            generate_html_directory(input_dir, output_dir, "Docs", [db_dir])
+
+            erd_content = (output_dir / "db" / "erd.html").read_text()
+            assert "<link rel='stylesheet' href='../assets/erd.css'>" in erd_content
+            assert "<style>" not in erd_content
+            assert ".tab-btn" in (output_dir / "assets" / "erd.css").read_text()
+
+
+class TestSchemaHtmlGeneration:
+    """Tests for schema-only documentation pages."""
+
+    def test_minify_css(self):
+        """Test comments and insignificant whitespace are stripped from CSS."""
+        from jsonui_test_cli.html.styles import minify_css
+
+        css = """
+    /* Layout */
+    .a:hover, .b > .c {
+      font-family: 'Segoe UI', sans-serif;
+      margin: 0 auto;
+    }
+    @media (max-width: 768px) {
+      .a { display: none; }
+    }
+"""
+        assert minify_css(css) == (
+            ".a:hover,.b > .c{font-family:'Segoe UI',sans-serif;margin:0 auto}"
+            "@media (max-width:768px){.a{display:none}}"
+        )
+
+    def test_schema_page_inlines_minified_css(self):
+        """Test schema pages embed the stylesheet on a single line."""
+        from jsonui_test_cli.html import generate_schema_html
+
+        html = generate_schema_html(
+            {"openapi": "3.0.0", "info": {"title": "Users"}, "components": {"schemas": {}}},
+            current_doc_path="db/users.html",
+        )
+        style = html.split("<style>", 1)[1].split("</style>", 1)[0]
+        assert "\n" not in style
+        assert "/*" not in style
+        assert ".sidebar{" in style
+
+    def test_page_stylesheets_are_minified(self):
+        """Test screen, flow and index stylesheets are served minified."""
+        from jsonui_test_cli.html import get_flow_styles, get_index_styles, get_screen_styles
+
+        for styles in (get_screen_styles(), get_flow_styles(), get_index_styles()):
+            assert "\n" not in styles
+            assert "/*" not in styles
+            assert ".sidebar{" in styles
+            assert styles.endswith("}}")
+
+
+class TestSwaggerHtmlGeneration:
+    """Tests for Redoc-based API documentation pages."""
+
+    def test_swagger_page_embeds_compact_spec(self):
+        """Test the spec is embedded as compact JSON with non-ASCII text kept."""
+        from jsonui_test_cli.html import generate_swagger_html
+
+        html = generate_swagger_html(
+            {"openapi": "3.0.0", "info": {"title": "ユーザー API"}, "paths": {}},
+            current_doc_path="api/users.html",
+        )
+        assert 'const spec = {"openapi":"3.0.0","info":{"title":"ユーザー API"},"paths":{}};' in html
+        assert "<title>ユーザー API</title>" in html
+        assert "href='../index.html'" in html
+
+    def test_swagger_page_compresses_large_spec(self):
+        """Test large specs are embedded gzip-compressed and base64-encoded."""
+        import base64
+        import gzip
+        import json
+        from jsonui_test_cli.html import generate_swagger_html
+
+        spec = {
+            "openapi": "3.0.0",
+            "info": {"title": "Big"},
+            "paths": {f"/items/{i}": {"get": {"summary": "Get item ✓ " * 10}} for i in range(1000)},
+        }
+        html = generate_swagger_html(spec, current_doc_path="api/big.html")
+
+        assert "const spec = " not in html
+        encoded = html.split("const specGz = '", 1)[1].split("'", 1)[0]
+        assert json.loads(gzip.decompress(base64.b64decode(encoded))) == spec
+        assert "DecompressionStream('gzip')" in html
+        assert html == generate_swagger_html(spec, current_doc_path="api/big.html")
+
+    def test_swagger_html_write_to_stream(self):
+        """Test swagger page streamed to a file object matches the returned string."""
+        import io
+        from jsonui_test_cli.html import generate_swagger_html
+
+        spec = {"openapi": "3.0.0", "info": {"title": "Pets"}, "paths": {"/pets": {}}}
+        expected = generate_swagger_html(spec, current_doc_path="api/pets.html")
+
+        buf = io.StringIO()
+        assert generate_swagger_html(spec, current_doc_path="api/pets.html", out=buf) is None
+        assert buf.getvalue() == expected
+        assert expected.endswith("</html>")
+
+    def test_load_swagger_file(self, tmp_path):
+        """Test only readable OpenAPI/Swagger JSON documents are loaded."""
+        import json
+        from jsonui_test_cli.html import is_swagger_file, load_swagger_file
+
+        spec = tmp_path / "api.json"
+        spec.write_text(json.dumps({"swagger": "2.0", "info": {"title": "Old"}}))
+        other = tmp_path / "layout.json"
+        other.write_text(json.dumps({"type": "View"}))
+        nested = tmp_path / "nested.json"
+        nested.write_text(json.dumps({"meta": {"openapi": "3.0.0"}}))
+        listing = tmp_path / "list.json"
+        listing.write_text(json.dumps(["openapi"]))
+        broken = tmp_path / "broken.json"
+        broken.write_text("{")
+        yaml_spec = tmp_path / "api.yaml"
+        yaml_spec.write_text("openapi: 3.0.0")
+
+        assert load_swagger_file(spec) == {"swagger": "2.0", "info": {"title": "Old"}}
+        assert is_swagger_file(spec)
+        for path in (other, nested, listing, broken, yaml_spec, tmp_path / "missing.json"):
+            assert load_swagger_file(path) is None
+            assert not is_swagger_file(path)
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])